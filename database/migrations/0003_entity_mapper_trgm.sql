@@ -0,0 +1,35 @@
+-- Migration: 0003_entity_mapper_trgm.sql
+-- Enables pg_trgm and adds trigram GIN indexes on the name columns the
+-- EntityMapper (src/common/entity_mapper.py) uses to prefilter candidates.
+-- Safe to run multiple times; uses existence checks.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Helper to create a trigram index if table and column exist
+-- Params:
+--   base_table: name of table queried by the mapper
+--   name_col:   text column compared with the `%` similarity operator
+CREATE OR REPLACE FUNCTION create_trgm_index_if_exists(
+    base_table TEXT,
+    name_col TEXT
+) RETURNS VOID AS $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = base_table
+          AND column_name = name_col
+    ) THEN
+        RETURN; -- table or column missing, skip
+    END IF;
+
+    EXECUTE format(
+        'CREATE INDEX IF NOT EXISTS %I ON public.%I USING GIN (%I gin_trgm_ops);',
+        ('ix_' || base_table || '_' || name_col || '_trgm'), base_table, name_col
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_trgm_index_if_exists('teams', 'name');
+SELECT create_trgm_index_if_exists('players', 'last_name');
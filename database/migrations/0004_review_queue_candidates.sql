@@ -0,0 +1,7 @@
+-- Migration: 0004_review_queue_candidates.sql
+-- Stores the ranked top-K match candidates ([{id, score}], best first) with each
+-- mapping_review_queue entry so reviewers can choose between near-matches.
+-- Safe to run multiple times.
+
+ALTER TABLE IF EXISTS mapping_review_queue
+    ADD COLUMN IF NOT EXISTS candidate_matches JSONB;
@@ -0,0 +1,8 @@
+-- Migration: 0005_review_queue_pending_index.sql
+-- Partial index serving EntityMapper's pending-review scan
+-- (WHERE review_status = 'pending' ORDER BY created_at).
+-- Safe to run multiple times.
+
+CREATE INDEX IF NOT EXISTS idx_mapping_review_queue_pending
+    ON mapping_review_queue(created_at)
+    WHERE review_status = 'pending';
@@ -1038,6 +1038,7 @@ CREATE TABLE mapping_review_queue (
     new_entity_data JSONB NOT NULL, -- Die kompletten Daten der neuen Quelle
     potential_match_id INTEGER, -- Die ID des gefundenen, möglichen Treffers
     confidence_score REAL, -- Der Score, der die Überprüfung ausgelöst hat
+    candidate_matches JSONB, -- Top-K Kandidaten [{id, score}], bester zuerst
     review_status VARCHAR(20) DEFAULT 'pending', -- 'pending', 'resolved', 'discarded'
     notes TEXT, -- Platz für Kommentare des Bearbeiters
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -1094,6 +1095,10 @@ CREATE INDEX idx_player_injury_date ON player_injury(injury_date);
 -- External ID mapping
 CREATE INDEX idx_external_id_map_entity ON external_id_map(entity_type, entity_id);
 
+-- Mapping review queue (pending items in FIFO order)
+CREATE INDEX idx_mapping_review_queue_pending ON mapping_review_queue(created_at)
+    WHERE review_status = 'pending';
+
 
 -- =========================
 -- Triggers to keep updated_at
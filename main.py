@@ -7,26 +7,24 @@ Koordiniert Data Collection, Analytics und API Services.
 
 import asyncio
 import logging
+import queue
 import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Windows-specific asyncio policy to avoid 'Event loop is closed' and transport warnings
-if sys.platform.startswith("win"):
-    try:
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    except Exception:
-        pass
-
-import uvicorn
-
-from src.api.main import create_fastapi_app
-from src.apps import SportsAnalyticsApp, SportsDataApp
+from src.common.event_loop import install_fast_loop
 from src.core.config import Settings
-from src.monitoring import HealthChecker, PrometheusMetrics, SystemMonitor
+
+# Schwere Abhängigkeiten (FastAPI/uvicorn, Monitoring, Apps) werden erst in den
+# Zweigen importiert, die sie brauchen; z.B. lädt collection_once keinen API Stack.
+if TYPE_CHECKING:  # pragma: no cover
+    from src.apps import SportsAnalyticsApp, SportsDataApp
+    from src.monitoring import HealthChecker, PrometheusMetrics, SystemMonitor
 
 
 class SportDataPipeline:
@@ -51,7 +49,6 @@ class SportDataPipeline:
         self.shutdown_event = asyncio.Event()
 
         self._setup_logging()
-        self._setup_signal_handlers()
 
     def _setup_logging(self):
         """Konfiguriert Logging"""
@@ -67,21 +64,45 @@ class SportDataPipeline:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(logging.Formatter(log_format))
 
-        # Root Logger
+        # Root Logger: nur Queue Handler im Event-Loop-Thread, Schreib-I/O im Listener-Thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_handlers = (console_handler, file_handler)
+        self._log_listener = QueueListener(log_queue, *self._log_handlers, respect_handler_level=True)
+        self._log_listener.start()
+
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, self.settings.log_level.upper()))
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+        self._queue_handler = QueueHandler(log_queue)
+        root_logger.addHandler(self._queue_handler)
+
+    def stop_logging(self):
+        """Schreibt die Queue leer und hängt Console/File Handler wieder direkt an den Root Logger"""
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._queue_handler)
+        self._log_listener.stop()
+        for handler in self._log_handlers:
+            root_logger.addHandler(handler)
 
     def _setup_signal_handlers(self):
-        """Konfiguriert Signal Handlers für graceful shutdown"""
+        """Konfiguriert Signal Handlers für graceful shutdown (im laufenden Event Loop aufrufen)"""
+        loop = asyncio.get_running_loop()
 
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.shutdown())
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown, sig)
+            except NotImplementedError:
+                # Windows: kein add_signal_handler; Event thread-safe über den Loop setzen
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(
+                        self._request_shutdown, signum
+                    ),
+                )
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+    def _request_shutdown(self, signum):
+        """Signal Callback: setzt nur das Shutdown Event, shutdown() läuft im Haupttask"""
+        self.logger.info(f"Received signal {signum}, initiating shutdown...")
+        self.shutdown_event.set()
 
     async def initialize(self):
         """Initialisiert alle Komponenten"""
@@ -90,12 +111,16 @@ class SportDataPipeline:
 
             # Data Collection App
             if self.settings.enable_data_collection:
+                from src.apps import SportsDataApp
+
                 self.data_app = SportsDataApp(self.settings)
                 await self.data_app.initialize()
                 self.logger.info("Data Collection App initialized")
 
             # Analytics App
             if self.settings.enable_analytics:
+                from src.apps import SportsAnalyticsApp
+
                 self.analytics_app = SportsAnalyticsApp(self.settings)
                 await self.analytics_app.initialize()
                 self.logger.info("Analytics App initialized")
@@ -104,6 +129,8 @@ class SportDataPipeline:
             from src.database.manager import DatabaseManager
             db_manager: DatabaseManager | None = None
             if self.settings.enable_monitoring:
+                from src.monitoring import HealthChecker, PrometheusMetrics, SystemMonitor
+
                 db_manager = DatabaseManager()
                 await db_manager.initialize()
 
@@ -119,6 +146,8 @@ class SportDataPipeline:
 
             # FastAPI App (inject shared db/metrics)
             if self.settings.enable_api:
+                from src.api.main import create_fastapi_app
+
                 self.fastapi_app = create_fastapi_app(
                     self.settings,
                     self.data_app,
@@ -208,6 +237,8 @@ class SportDataPipeline:
             self.logger.warning("FastAPI app not initialized, skipping API server")
             return
 
+        import uvicorn
+
         config = uvicorn.Config(
             self.fastapi_app,
             host=self.settings.api_host,
@@ -235,6 +266,7 @@ class SportDataPipeline:
 
     async def run(self):
         """Hauptausführung der Pipeline"""
+        self._setup_signal_handlers()
         try:
             await self.initialize()
 
@@ -284,6 +316,8 @@ class SportDataPipeline:
             self.logger.error(f"Pipeline execution failed: {e}")
             raise
         finally:
+            if self.shutdown_event.is_set():
+                await self.shutdown()
             await self.cleanup()
 
     async def _run_interactive_mode(self):
@@ -300,9 +334,22 @@ class SportDataPipeline:
         print("  quit        - Exit application")
         print("=" * 50)
 
+        import aioconsole
+
         while not self.shutdown_event.is_set():
             try:
-                command = input("\n> ").strip().lower()
+                # Nicht-blockierende Eingabe; ein Shutdown beendet den offenen Prompt
+                input_task = asyncio.ensure_future(aioconsole.ainput("\n> "))
+                shutdown_task = asyncio.ensure_future(self.shutdown_event.wait())
+                done, pending = await asyncio.wait(
+                    {input_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in pending:
+                    task.cancel()
+                if input_task not in done:
+                    break
+
+                command = input_task.result().strip().lower()
 
                 if command == "collect":
                     if self.data_app:
@@ -449,6 +496,7 @@ class SportDataPipeline:
 
 async def main():
     """Haupteinstiegspunkt"""
+    pipeline = None
     try:
         # Load settings
         settings = Settings()
@@ -462,7 +510,13 @@ async def main():
     except Exception as e:
         logging.error(f"Pipeline failed: {e}")
         sys.exit(1)
+    finally:
+        # Erst nach dem letzten Log Record (auch "Pipeline failed") den Listener stoppen
+        if pipeline is not None:
+            pipeline.stop_logging()
 
 
 if __name__ == "__main__":
+    # uvloop/winloop bzw. Selector-Policy unter Windows (vermeidet 'Event loop is closed')
+    install_fast_loop()
     asyncio.run(main())
@@ -0,0 +1,21 @@
+"""Shared asyncio entry point for the scripts: runs on the fastest available loop.
+
+Usage:
+  from scripts._runner import run
+  run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+from src.common.event_loop import install_fast_loop
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """``asyncio.run`` after ``install_fast_loop()`` (uvloop, winloop or the selector loop)."""
+    install_fast_loop()
+    return asyncio.run(coro)
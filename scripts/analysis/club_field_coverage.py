@@ -7,11 +7,13 @@ Usage:
 """
 from __future__ import annotations
 
-import json
 import sys
-from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 
+import ijson  # type: ignore
+import numpy as np
+
 ROOT = Path(__file__).resolve().parents[2]
 SRC = ROOT / "src"
 if str(ROOT) not in sys.path:
@@ -27,18 +29,31 @@ def load_clubs():
     candidates = [REPORTS_DIR / "clubs_enriched.json", REPORTS_DIR / "clubs.json"]
     for c in candidates:
         if c.exists():
-            with c.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return _iter_clubs(c)
     raise SystemExit("No clubs*.json file found in reports directory")
 
 
-def compute_field_coverage(clubs):
-    field_counts = defaultdict(int)
-    total = len(clubs)
-    for club in clubs:
-        for k, v in club.items():
-            if v not in (None, "", [], {}):
-                field_counts[k] += 1
+def _iter_clubs(path: Path):
+    """Stream club records one by one instead of parsing the whole file."""
+    with path.open("rb") as f:
+        yield from ijson.items(f, "item")
+
+
+def compute_field_coverage(clubs, chunk_size: int = 1000):
+    field_counts: dict[str, int] = {}
+    total = 0
+    clubs = iter(clubs)
+    # Reduce one (chunk x fields) bitmap at a time so memory stays bounded while streaming
+    while chunk := list(islice(clubs, chunk_size)):
+        keys = sorted({k for club in chunk for k in club})
+        populated = np.array(
+            [[club.get(k) not in (None, "", [], {}) for k in keys] for club in chunk],
+            dtype=bool,
+        )
+        for k, count in zip(keys, populated.sum(axis=0)):
+            if count:
+                field_counts[k] = field_counts.get(k, 0) + int(count)
+        total += len(chunk)
     coverage = {k: round(v / total * 100, 1) for k, v in field_counts.items()}
     return coverage, total
 
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import sys
 from pathlib import Path
@@ -11,24 +13,39 @@ import traceback
 
 import httpx
 
+from scripts._runner import run
 from src.api.main import create_fastapi_app
 from src.core.config import Settings
 
+DEFAULT_PATHS = ["/health"]
+
+
+async def main(paths: list[str] | None = None):
+    """Hit the given paths (default: /health) against an in-process app.
 
-async def main():
+    App, lifespan and client are set up once; requests run concurrently.
+    Usage: python scripts/api_health_smoke.py [/health /admin/ping ...]
+    """
+    paths = paths or DEFAULT_PATHS
     # Minimize feature set to focus on API only
     settings = Settings()
     try:
         app = create_fastapi_app(settings, data_app=None, analytics_app=None)
-        transport = httpx.ASGITransport(app=app)
-        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/health")
-            print("/health status:", resp.status_code, flush=True)
-            print("/health body:", resp.json(), flush=True)
+        # ASGITransport does not run lifespan events; enter them once here.
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                results = await asyncio.gather(*(client.get(p) for p in paths), return_exceptions=True)
+        for path, resp in zip(paths, results):
+            if isinstance(resp, Exception):
+                print(f"{path} failed:", resp, flush=True)
+                continue
+            print(f"{path} status:", resp.status_code, flush=True)
+            print(f"{path} body:", resp.text, flush=True)
     except Exception as e:
         print("API health smoke failed:", e, flush=True)
         print(traceback.format_exc(), flush=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main(sys.argv[1:]))
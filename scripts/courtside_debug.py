@@ -9,31 +9,192 @@ Modi (via --mode):
   raw      - reiner HTML Dump
 
 Beispiele:
-  python scripts/courtside_debug.py --mode minimal --headless
+  python scripts/courtside_debug.py --mode minimal --headful --hold 60
   python scripts/courtside_debug.py --mode fixtures --json > fixtures.json
   python scripts/courtside_debug.py --mode analyze --out-dir reports/courtside
+  python scripts/courtside_debug.py --modes inspect analyze --persist
+  python scripts/courtside_debug.py --mode fixtures --api-url <url aus api_urls> --json
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
 import sys
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from src.common.playwright_utils import browser_page
+import httpx
+import msgspec
+import orjson
+import zstandard
+
+from scripts._runner import run as run_coro
+from src.common.playwright_utils import browser_page, parse_captured_json
 
 URL = "https://www.courtside1891.basketball/games"
 
+# Selectors probed by the inspect mode. Passed to the page as data (never spliced
+# into JS source), so quoting cannot break the probe.
+INSPECT_SELECTORS = [
+    '[data-testid*="fixture"]',
+    '[class*="fixture"]',
+    '[data-testid*="game"]',
+    'a[href*="/game/"]',
+]
+
+# Page-side helpers, installed once per page via add_init_script so each
+# evaluate only sends a short call expression instead of the full source.
+_JS_HELPERS = r"""
+(() => {
+const WS = /\s+/g;
+const clean = (s, n) => (s || '').trim().replace(WS, ' ').slice(0, n);
+const text = (root, sel) => root?.querySelector(sel)?.textContent?.trim() || null;
+window.__cs = {
+    // Hands each row to the exposed __csOnFixture binding as soon as it is built
+    // instead of materializing the whole array; resolves to the row count.
+    streamFixtures: () => {
+        const rows = Array.from(document.querySelectorAll('[data-testid="fixture-row"]'));
+        return Promise.all(rows.map(row => window.__csOnFixture({
+            home: text(row, '[data-testid="team-home"]'),
+            away: text(row, '[data-testid="team-away"]'),
+            score: text(row, '[data-testid="fixture-score"]'),
+            competition: text(
+                row.closest('[data-testid="competition-fixtures"]'),
+                '[data-testid="competition-name"]'
+            )
+        }))).then(done => done.length);
+    },
+    testIds: (limit) => Array.from(document.querySelectorAll('[data-testid]'))
+        .slice(0, limit)
+        .map(el => ({
+            tag: el.tagName,
+            testid: el.getAttribute('data-testid'),
+            text: clean(el.textContent, 80)
+        })),
+    // Whole inspect sweep in one call: test ids plus count and first match per selector.
+    inspect: ({selectors, limit}) => {
+        const counts = {}, samples = {};
+        for (const s of selectors) {
+            let els = [];
+            // An invalid selector counts as 0
+            try { els = document.querySelectorAll(s); } catch (e) { /* ignore */ }
+            const first = els[0];
+            counts[s] = els.length;
+            samples[s] = first ? {
+                tag: first.tagName,
+                id: first.id || null,
+                classes: first.getAttribute('class'),
+                text: clean(first.textContent, 100),
+                html: first.outerHTML.slice(0, 200)
+            } : null;
+        }
+        return {
+            test_ids: window.__cs.testIds(limit),
+            selector_counts: counts,
+            selector_samples: samples
+        };
+    },
+    containers: () => ['main', 'body', 'div[role="main"]', '.MuiContainer-root', 'div#root']
+        .map(s => {
+            const els = Array.from(document.querySelectorAll(s));
+            const sample = els[0]
+                ? {tag: els[0].tagName, text: clean(els[0].textContent, 120)}
+                : null;
+            return {selector: s, count: els.length, sample};
+        }),
+    resources: () => Array.from(performance.getEntriesByType('resource'))
+        .filter(r => r.initiatorType === 'xmlhttprequest'
+            || /api|graphql|fixture|game/i.test(r.name))
+        .slice(0, 40)
+        .map(r => ({
+            name: r.name,
+            type: r.initiatorType,
+            duration: r.duration,
+            transfer: r.transferSize
+        })),
+};
+})();
+"""
+
+
+class TestId(msgspec.Struct):
+    """One ``[data-testid]`` element as returned by ``window.__cs.testIds``."""
+
+    tag: str
+    testid: str
+    text: str
+
+
+class SelectorSample(msgspec.Struct):
+    """First element matched by an inspected selector."""
+
+    tag: str
+    id: str | None
+    classes: str | None
+    text: str
+    html: str
+
+
+class InspectReport(msgspec.Struct):
+    """Payload of ``window.__cs.inspect``."""
+
+    test_ids: list[TestId]
+    selector_counts: dict[str, int]
+    selector_samples: dict[str, SelectorSample | None]
+
+
+# Decodes the stringified payload straight into structs, no dict per element.
+_TEST_IDS_DECODER = msgspec.json.Decoder(list[TestId])
+_INSPECT_DECODER = msgspec.json.Decoder(InspectReport)
+
 
 def _ts() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def _default(obj: Any) -> Any:
+    if isinstance(obj, msgspec.Struct):
+        return msgspec.to_builtins(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes."""
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def _dump(path: str, obj: Any) -> None:
+    Path(path).write_bytes(_dumps(obj))
+
+
+def _loads(raw: str | bytes | None) -> Any:
+    if raw is None:
+        return None
+    return orjson.loads(raw)
+
+
+async def _eval_json(page, js: str, arg: Any = None, decoder: Any = None) -> Any:
+    """Evaluate a JS function and transfer its result as one JSON string.
+
+    The payload is stringified in the browser and parsed with orjson (or the
+    given msgspec ``decoder``) instead of going through Playwright's structured
+    value deserialization.
+    """
+    raw = await page.evaluate(f"(arg) => JSON.stringify(({js})(arg))", arg)
+    if decoder is not None and raw is not None:
+        return decoder.decode(raw)
+    return _loads(raw)
+
+
+async def _call(page, name: str, arg: Any = None, decoder: Any = None) -> Any:
+    """Invoke one of the ``window.__cs`` helpers from ``_JS_HELPERS``."""
+    return await _eval_json(page, f"(a) => window.__cs.{name}(a)", arg, decoder)
+
+
 async def _ensure_out_dir(path: str) -> str:
     os.makedirs(path, exist_ok=True)
     return path
@@ -42,31 +203,56 @@ async def _ensure_out_dir(path: str) -> str:
 async def _wait(page, selector: str | None, timeout: int):
     if selector:
         try:
-            await page.wait_for_selector(selector, timeout=timeout)
+            await page.wait_for_selector(selector, state="attached", timeout=timeout)
         except Exception:
             pass
 
 
+async def _settle(page, timeout: float = 5) -> None:
+    """Bounded networkidle wait; telemetry-heavy pages may never go idle."""
+    try:
+        await asyncio.wait_for(page.wait_for_load_state("networkidle"), timeout=timeout)
+    except Exception:
+        pass
+
+
+async def _screenshot(page, out: str, prefix: str, fmt: str) -> str:
+    ext = "jpg" if fmt == "jpeg" else fmt
+    path = os.path.join(out, f"{prefix}_{_ts()}.{ext}")
+    opts: dict[str, Any] = {"type": fmt}
+    if fmt == "jpeg":
+        opts["quality"] = 70
+    await page.screenshot(path=path, full_page=True, **opts)
+    return path
+
+
+async def _write_html(out: str, prefix: str, html: str, compress: bool = False) -> str:
+    """Write an HTML dump off the event loop, zstd-compressed (level 3) when requested."""
+    data = html.encode("utf-8")
+    ext = "html"
+    if compress:
+        data = await asyncio.to_thread(zstandard.ZstdCompressor(level=3).compress, data)
+        ext = "html.zst"
+    path = os.path.join(out, f"{prefix}_{_ts()}.{ext}")
+    await asyncio.to_thread(Path(path).write_bytes, data)
+    return path
+
+
 async def mode_minimal(page, args):
     await page.goto(URL, timeout=args.timeout, wait_until="domcontentloaded")
     await _wait(page, args.wait_selector, args.timeout)
     out = await _ensure_out_dir(args.out_dir)
-    sc = os.path.join(out, f"courtside_minimal_{_ts()}.png")
-    await page.screenshot(path=sc, full_page=True)
-    html_path = os.path.join(out, f"courtside_minimal_{_ts()}.html")
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(await page.content())
+    sc = await _screenshot(page, out, "courtside_minimal", args.screenshot_format)
+    html_path = await _write_html(out, "courtside_minimal", await page.content(), args.zstd)
     return {"screenshot": sc, "html": html_path}
 
 
 async def mode_snapshot(page, args):
-    await page.goto(URL, timeout=args.timeout, wait_until="networkidle")
+    await page.goto(URL, timeout=args.timeout, wait_until="domcontentloaded")
+    await _wait(page, args.wait_selector, args.timeout)
     out = await _ensure_out_dir(args.out_dir)
-    sc = os.path.join(out, f"courtside_snapshot_{_ts()}.png")
-    await page.screenshot(path=sc, full_page=True)
-    html_path = os.path.join(out, f"courtside_snapshot_{_ts()}.html")
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(await page.content())
+    sc = await _screenshot(page, out, "courtside_snapshot", args.screenshot_format)
+    html_path = await _write_html(out, "courtside_snapshot", await page.content(), args.zstd)
     return {"screenshot": sc, "html": html_path}
 
 
@@ -74,70 +260,89 @@ async def mode_raw(page, args):
     await page.goto(URL, timeout=args.timeout)
     html = await page.content()
     out = await _ensure_out_dir(args.out_dir)
-    path = os.path.join(out, f"courtside_raw_{_ts()}.html")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(html)
+    path = await _write_html(out, "courtside_raw", html, args.zstd)
     return {"html": path}
 
 
-async def _extract_fixtures(page):
-    return await page.evaluate(
-        """() => {
-        return Array.from(document.querySelectorAll('[data-testid="fixture-row"]')).map(row => ({
-            home: row.querySelector('[data-testid="team-home"]')?.textContent?.trim() || null,
-            away: row.querySelector('[data-testid="team-away"]')?.textContent?.trim() || null,
-            score: row.querySelector('[data-testid="fixture-score"]')?.textContent?.trim() || null,
-            competition: row.closest('[data-testid="competition-fixtures"]')?.querySelector('[data-testid="competition-name"]')?.textContent?.trim() || null
-        }));
-    }"""
-    )
+# Per-page row sink for the __csOnFixture binding (a binding can be exposed once per page).
+_fixture_sinks: weakref.WeakKeyDictionary[Any, list[dict[str, Any]]] = weakref.WeakKeyDictionary()
+
+
+async def _extract_fixtures(page) -> list[dict[str, Any]]:
+    """Collect fixture rows from the DOM, delivered one by one via page.expose_binding."""
+    if page not in _fixture_sinks:
+        _fixture_sinks[page] = []
+        await page.expose_binding(
+            "__csOnFixture", lambda _source, row: _fixture_sinks[page].append(row)
+        )
+    rows = _fixture_sinks[page] = []
+    await page.evaluate("() => window.__cs.streamFixtures()")
+    return rows
 
 
 async def mode_fixtures(page, args):
-    await page.goto(URL, timeout=args.timeout, wait_until="networkidle")
+    # Prefer the JSON the page fetches over scraping the rendered DOM.
+    captured: list[dict[str, Any]] = []
+    found = asyncio.Event()
+
+    async def on_resp(resp):
+        try:
+            if resp.request.resource_type not in ("xhr", "fetch"):
+                return
+            if "json" not in (resp.headers.get("content-type") or "").lower():
+                return
+            item = {"url": resp.url, "data": _loads(await resp.body())}
+        except Exception:
+            return
+        captured.append(item)
+        if parse_captured_json([item]):
+            found.set()
+
+    page.on("response", on_resp)
+    try:
+        await page.goto(URL, timeout=args.timeout, wait_until="domcontentloaded")
+        try:
+            await asyncio.wait_for(found.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            pass
+    finally:
+        page.remove_listener("response", on_resp)
+    if found.is_set():
+        fixtures = parse_captured_json(captured)
+        # Endpoints that carried fixtures; pass one via --api-url to skip the browser.
+        api_urls = sorted({item["url"] for item in captured if parse_captured_json([item])})
+        return {
+            "count": len(fixtures),
+            "source": "network",
+            "api_urls": api_urls,
+            "fixtures": fixtures,
+        }
     await _wait(page, args.wait_selector, args.timeout)
     fixtures = await _extract_fixtures(page)
-    return {"count": len(fixtures), "fixtures": fixtures}
+    return {"count": len(fixtures), "source": "dom", "fixtures": fixtures}
 
 
 async def mode_inspect(page, args):
     await page.goto(URL, timeout=args.timeout, wait_until="domcontentloaded")
     await _wait(page, args.wait_selector, args.timeout)
-    test_ids = await page.evaluate(
-        """() => Array.from(document.querySelectorAll('[data-testid]')).slice(0,50).map(el => ({
-            tag: el.tagName,
-            testid: el.getAttribute('data-testid'),
-            text: el.textContent.trim().replace(/\s+/g,' ').substring(0,80)
-        }))"""
+    # One round-trip for test ids, selector counts and samples.
+    report = await _call(
+        page, "inspect", {"selectors": INSPECT_SELECTORS, "limit": 50}, _INSPECT_DECODER
     )
-    selectors = [
-        '[data-testid*="fixture"]','[class*="fixture"]','[data-testid*="game"]','a[href*="/game/"]'
-    ]
-    selector_counts = {}
-    for sel in selectors:
-        try:
-            c = await page.evaluate(f"() => document.querySelectorAll('{sel}').length")
-            selector_counts[sel] = c
-        except Exception:
-            selector_counts[sel] = 0
-    return {"test_ids": test_ids, "selector_counts": selector_counts}
+    return msgspec.structs.asdict(report)
 
 
 async def mode_analyze(page, args):
-    await page.goto(URL, timeout=args.timeout, wait_until="networkidle")
+    await page.goto(URL, timeout=args.timeout, wait_until="domcontentloaded")
     await _wait(page, args.wait_selector, args.timeout)
-    containers = await page.evaluate(
-        """() => {
-        const sels = ['main','body','div[role="main"]','.MuiContainer-root','div#root'];
-        return sels.map(s => { const els = Array.from(document.querySelectorAll(s)); return {selector:s,count:els.length,sample:els[0]?{tag:els[0].tagName,text:els[0].textContent.trim().substring(0,120)}:null};});
-    }"""
-    )
-    fixtures = await _extract_fixtures(page)
-    resources = await page.evaluate(
-        """() => Array.from(performance.getEntriesByType('resource')).filter(r=>r.initiatorType==='xmlhttprequest'||/api|graphql|fixture|game/i.test(r.name)).slice(0,40).map(r=>({name:r.name,type:r.initiatorType,duration:r.duration,transfer:r.transferSize}))"""
-    )
-    test_ids_sample = await page.evaluate(
-        """() => Array.from(document.querySelectorAll('[data-testid]')).slice(0,30).map(el=>({testid:el.getAttribute('data-testid'),tag:el.tagName,text:el.textContent.trim().substring(0,80)}))"""
+    # the resource inventory below benefits from late XHRs, but only briefly
+    await _settle(page)
+    # Independent read-only DOM queries: overlap their CDP round-trips.
+    containers, fixtures, resources, test_ids_sample = await asyncio.gather(
+        _call(page, "containers"),
+        _extract_fixtures(page),
+        _call(page, "resources"),
+        _call(page, "testIds", 30, _TEST_IDS_DECODER),
     )
     out_dir = await _ensure_out_dir(args.out_dir)
     report_path = os.path.join(out_dir, f"courtside_analysis_{_ts()}.json")
@@ -150,9 +355,11 @@ async def mode_analyze(page, args):
         "test_ids": test_ids_sample,
         "timestamp": datetime.utcnow().isoformat(),
     }
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
-    return {"analysis_file": report_path, "summary": {k: payload[k] for k in ("fixtures_found","containers")}}
+    _dump(report_path, payload)
+    return {
+        "analysis_file": report_path,
+        "summary": {k: payload[k] for k in ("fixtures_found", "containers")},
+    }
 
 
 MODES: dict[str, Any] = {
@@ -164,29 +371,126 @@ MODES: dict[str, Any] = {
     "analyze": mode_analyze,
 }
 
+SCREENSHOT_MODES = {"minimal", "snapshot"}
+
+
+async def fetch_fixtures_api(url: str, timeout_ms: int) -> dict[str, Any] | None:
+    """Fetch fixtures straight from a JSON endpoint; None on HTTP/transport errors."""
+    try:
+        async with httpx.AsyncClient(timeout=timeout_ms / 1000, follow_redirects=True) as client:
+            resp = await client.get(url, headers={"accept": "application/json"})
+            resp.raise_for_status()
+            data = _loads(resp.content)
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"API fetch failed ({e}), falling back to browser", file=sys.stderr)
+        return None
+    fixtures = parse_captured_json([{"url": url, "data": data}])
+    return {"count": len(fixtures), "source": "api", "fixtures": fixtures}
+
+
+def _emit(args, mode: str, result: Any) -> None:
+    if args.json:
+        sys.stdout.buffer.write(_dumps(result) + b"\n")
+        sys.stdout.flush()
+    else:
+        print(f"Mode '{mode}' finished -> {result}")
+
 
 async def run(args):
-    mode_fn = MODES[args.mode]
+    modes = args.modes or [args.mode]
+    if args.api_url and "fixtures" in modes:
+        result = await fetch_fixtures_api(args.api_url, args.timeout)
+        if result is not None:
+            _emit(args, "fixtures", result)
+            modes = [m for m in modes if m != "fixtures"]
+            if not modes:
+                return
     viewport = None
     if args.viewport is not None:
         viewport = {"width": args.viewport[0], "height": args.viewport[1]}
-    async with browser_page(headless=args.headless, viewport=viewport) as page:
-        result = await mode_fn(page, args)
-        if args.json:
-            print(json.dumps(result, ensure_ascii=False, indent=2))
-        else:
-            print(f"Mode '{args.mode}' finished -> {result}")
+    block_assets = args.block_assets
+    if block_assets is None:
+        # Screenshot modes need CSS/images to render faithfully.
+        block_assets = not SCREENSHOT_MODES.intersection(modes)
+    user_data_dir = os.path.join(args.out_dir, ".profile") if args.persist else None
+    # A persistent profile already keeps cookies; otherwise optionally carry them in a state file.
+    storage_state = None
+    if args.reuse_state and not args.persist:
+        storage_state = os.path.join(await _ensure_out_dir(args.out_dir), "state.json")
+    async with browser_page(
+        headless=not args.headful,
+        viewport=viewport,
+        block_assets=block_assets,
+        user_data_dir=user_data_dir,
+        storage_state=storage_state,
+    ) as page:
+        await page.add_init_script(_JS_HELPERS)
+        # All modes share one browser launch; with --persist also the disk cache.
+        for mode in modes:
+            _emit(args, mode, await MODES[mode](page, args))
+        if args.hold:
+            # Keep a --headful window open without blocking the loop (CDP events keep draining).
+            await asyncio.sleep(args.hold)
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Unified Courtside1891 debug tool")
     p.add_argument("--mode", choices=sorted(MODES.keys()), default="minimal")
-    p.add_argument("--headless", action="store_true", help="Run headless")
+    p.add_argument(
+        "--modes",
+        nargs="+",
+        choices=sorted(MODES.keys()),
+        help="Run several modes in sequence on the same page (overrides --mode)",
+    )
+    p.add_argument(
+        "--api-url",
+        help="JSON endpoint for the fixtures mode (see api_urls in its output); "
+        "fetched without a browser, which is only used as fallback on errors",
+    )
+    p.add_argument(
+        "--reuse-state",
+        action="store_true",
+        help="Load/save cookies and local storage in <out-dir>/state.json across runs",
+    )
+    p.add_argument(
+        "--persist",
+        action="store_true",
+        help="Use a persistent browser profile in <out-dir>/.profile (keeps HTTP cache)",
+    )
+    p.add_argument(
+        "--headful", action="store_true", help="Show the browser window (default: headless)"
+    )
+    p.add_argument(
+        "--hold",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Keep the browser open this long after the last mode (useful with --headful)",
+    )
+    # headless is the default now; flag kept so existing invocations keep working
+    p.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
     p.add_argument("--timeout", type=int, default=90000)
     p.add_argument("--wait-selector", dest="wait_selector", default='[data-testid="fixture-row"]')
     p.add_argument("--out-dir", default="reports/courtside")
     p.add_argument("--json", action="store_true", help="Print JSON only")
     p.add_argument("--viewport", type=str, default="1366x768", help="WIDTHxHEIGHT or 'none'")
+    p.add_argument(
+        "--screenshot-format",
+        choices=["png", "jpeg"],
+        default="jpeg",
+        help="Screenshot encoding (jpeg at quality 70 is much cheaper than png)",
+    )
+    p.add_argument(
+        "--zstd",
+        action="store_true",
+        help="Write HTML dumps as .html.zst",
+    )
+    p.add_argument(
+        "--block-assets",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Abort images/fonts/media/styles and analytics (default: on, off for screenshots)",
+    )
     args = p.parse_args(argv)
     if args.viewport.lower() == "none":
         args.viewport = None
@@ -202,7 +506,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 def main(argv: list[str] | None = None):
     args = parse_args(argv or sys.argv[1:])
-    asyncio.run(run(args))
+    run_coro(run(args))
 
 
 if __name__ == "__main__":
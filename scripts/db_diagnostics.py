@@ -9,52 +9,60 @@ import asyncio
 import sys
 from typing import Any
 
-from src.database.manager import DatabaseManager
-from src.core.config import Settings
+from scripts._runner import run
+from src.database.manager import DatabaseManager, get_database_manager
+from src.core.config import get_settings
 
 
-async def main() -> int:
-    settings = Settings()
-    db = DatabaseManager()
-
-    # Results container
-    results: dict[str, Any] = {
-        "dsn": settings.database_url,
-        "sync": {},
-        "async": {},
-    }
-
-    # Initialize sync + async
+def _sync_probe(db: DatabaseManager) -> dict[str, Any]:
+    """Initialize the SQLAlchemy engine and run SELECT 1 (blocking; run in a thread)."""
+    result: dict[str, Any] = {}
     try:
         db.initialize_sync()
-        results["sync"] = {"ok": True}
+        result["ok"] = True
     except Exception as e:  # pragma: no cover
-        results["sync"] = {"ok": False, "error": str(e)}
-
-    try:
-        await db.initialize_async()
-        results["async"] = {"ok": True}
-    except Exception as e:  # pragma: no cover
-        results["async"] = {"ok": False, "error": str(e)}
-
-    # Simple queries
+        return {"ok": False, "error": str(e)}
     try:
-        # Sync check
         if db.engine is not None:
             with db.engine.connect() as conn:
                 conn.exec_driver_sql("SELECT 1")
-            results["sync"]["query"] = "ok"
+            result["query"] = "ok"
     except Exception as e:  # pragma: no cover
-        results["sync"]["query"] = f"error: {e}"
+        result["query"] = f"error: {e}"
+    return result
 
+
+async def _async_probe(db: DatabaseManager) -> dict[str, Any]:
+    """Initialize the asyncpg pool and run SELECT 1."""
+    result: dict[str, Any] = {}
+    try:
+        # a single probe connection is enough
+        await db.initialize_async(min_size=1, max_size=2)
+        result["ok"] = True
+    except Exception as e:  # pragma: no cover
+        return {"ok": False, "error": str(e)}
     try:
-        # Async check
         if db.pool is not None:
             async with db.get_async_connection() as conn:
                 await conn.fetchval("SELECT 1")
-            results["async"]["query"] = "ok"
+            result["query"] = "ok"
     except Exception as e:  # pragma: no cover
-        results["async"]["query"] = f"error: {e}"
+        result["query"] = f"error: {e}"
+    return result
+
+
+async def main() -> int:
+    settings = get_settings()
+    db = get_database_manager()
+
+    # The sync (psycopg2) and async (asyncpg) paths are independent; probe both
+    # concurrently so the wall time is the slower handshake, not the sum.
+    sync_res, async_res = await asyncio.gather(asyncio.to_thread(_sync_probe, db), _async_probe(db))
+    results: dict[str, Any] = {
+        "dsn": settings.database_url,
+        "sync": sync_res,
+        "async": async_res,
+    }
 
     # Print concise outcome
     sync_ok = results["sync"].get("ok") is True and results["sync"].get("query") == "ok"
@@ -76,6 +84,6 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(run(main()))
 
 
@@ -1,5 +1,6 @@
 import asyncio
-from src.database.manager import DatabaseManager
+from scripts._runner import run
+from src.database.manager import get_database_manager
 from src.database.services.external_id_mapping_service_async import (
     ExternalIdMappingServiceAsync,
     MappingConflictError,
@@ -11,6 +12,7 @@ from src.common.constants import Source
 # 2) Applies mapping for fbref external IDs
 # 3) Reads mappings back
 # 4) Demonstrates conflict handling
+# Independent player/team calls run concurrently on two pool connections.
 
 CREATE_PLAYER_SQL = """
 INSERT INTO player (first_name, last_name)
@@ -25,14 +27,18 @@ RETURNING team_id
 """
 
 async def main():
-    db = DatabaseManager()
-    await db.initialize_async()
+    db = get_database_manager()
+    # The demo uses two connections at once; don't open the app-sized pool
+    await db.initialize_async(min_size=2, max_size=10)
     svc = ExternalIdMappingServiceAsync()
 
-    async with db.get_async_connection() as conn:
+    # Two pool connections so the independent player/team statements overlap
+    async with db.pool.acquire() as conn, db.pool.acquire() as conn_b:
         # Create minimal dummy rows (idempotent-like via try except on unique not present; we just insert new rows)
-        player_id = await conn.fetchval(CREATE_PLAYER_SQL, "Demo", "Player")
-        team_id = await conn.fetchval(CREATE_TEAM_SQL)
+        player_id, team_id = await asyncio.gather(
+            conn.fetchval(CREATE_PLAYER_SQL, "Demo", "Player"),
+            conn_b.fetchval(CREATE_TEAM_SQL),
+        )
 
         # External IDs (examples)
         ext_player_id = "p_demo_1"
@@ -40,17 +46,27 @@ async def main():
         source = Source.FBREF
 
         # Ensure mappings (idempotent)
-        pid = await svc.ensure_player(conn, source=source, external_id=ext_player_id, player_id=player_id)
-        tid = await svc.ensure_team(conn, source=source, external_id=ext_team_id, team_id=team_id)
+        pid, tid = await asyncio.gather(
+            svc.ensure_player(conn, source=source, external_id=ext_player_id, player_id=player_id),
+            svc.ensure_team(conn_b, source=source, external_id=ext_team_id, team_id=team_id),
+        )
         print(f"Player mapped: {ext_player_id} -> {pid}")
         print(f"Team mapped:   {ext_team_id} -> {tid}")
 
         # Read back
-        pid2 = await svc.find_player(conn, source=source, external_id=ext_player_id)
-        tid2 = await svc.find_team(conn, source=source, external_id=ext_team_id)
+        pid2, tid2 = await asyncio.gather(
+            svc.find_player(conn, source=source, external_id=ext_player_id),
+            svc.find_team(conn_b, source=source, external_id=ext_team_id),
+        )
         print(f"Found player mapping: {ext_player_id} -> {pid2}")
         print(f"Found team mapping:   {ext_team_id} -> {tid2}")
 
+        # Batch variant: many mappings of one entity in two round trips
+        batch = await svc.ensure_many(
+            conn, entity="player", source=source, mappings=[(ext_player_id, player_id)]
+        )
+        print(f"Batch ensure: {batch}")
+
         # Conflict demo
         try:
             await svc.ensure_player(conn, source=source, external_id=ext_player_id, player_id=player_id + 1)
@@ -60,4 +76,4 @@ async def main():
     await db.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -14,7 +14,7 @@ Usage (PowerShell):
   python scripts/diagnose/courtside_scraper_diagnose.py [--limit N] [--debug]
 
 Environment:
-  Relies on Settings() for configuration; ensures local `src/` is on sys.path.
+  Relies on get_settings() for configuration; ensures local `src/` is on sys.path.
 
 NOTE: This script intentionally performs live network & browser automation calls and is
 NOT meant for automated CI. Use manually for investigation.
@@ -29,11 +29,11 @@ import logging
 import os
 import sys
 import time
-from collections import defaultdict
+from collections import Counter
 from pathlib import Path
 from typing import Any, List
 
-from playwright.async_api import async_playwright
+import orjson
 
 # --- Path setup -----------------------------------------------------------------
 ROOT = Path(__file__).resolve().parent.parent.parent  # project root
@@ -41,16 +41,29 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from src.core.config import Settings  # type: ignore  # noqa: E402
+from scripts._runner import run  # type: ignore  # noqa: E402
+from src.core.config import get_settings  # type: ignore  # noqa: E402
 from src.data_collection.scrapers.courtside_scraper import CourtsideScraper  # type: ignore  # noqa: E402
 from src.common.logging_utils import configure_logging, get_logger  # type: ignore  # noqa: E402
+from src.common.playwright_utils import close_browser_pool, get_browser_pool  # type: ignore  # noqa: E402
 
 logger = get_logger("courtside.diagnose")
 
 
+# --- Output helpers -------------------------------------------------------------
+def _dumps(obj: Any) -> bytes:
+    """Indented UTF-8 JSON bytes."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+async def _write_json(path: str, obj: Any) -> None:
+    """Serialize and write off the event loop; result lists can be large."""
+    await asyncio.to_thread(lambda: Path(path).write_bytes(_dumps(obj)))
+
+
 # --- Core diagnostic routine ----------------------------------------------------
 async def run_diagnostics(limit: int | None, enable_debug: bool) -> None:
-    settings = Settings()
+    settings = get_settings()
     scraper = CourtsideScraper(None, settings)  # No DB usage here
 
     if enable_debug:
@@ -82,16 +95,17 @@ async def run_diagnostics(limit: int | None, enable_debug: bool) -> None:
     # Sample fixture
     logger.info("Sample fixture:\n%s", json.dumps(results[0], indent=2, ensure_ascii=False))
 
-    # Competition distribution
-    comp_counts: dict[str, int] = defaultdict(int)
+    # Competition distribution + data quality check in one pass
+    comp_counts: Counter[str] = Counter()
+    missing: List[dict[str, Any]] = []
     for fx in results:
         comp_counts[fx.get("competition", "Unknown")] += 1
+        if not (fx.get("home_team") and fx.get("away_team")):
+            missing.append(fx)
     logger.info("Competition distribution:")
-    for comp, count in sorted(comp_counts.items(), key=lambda x: x[1], reverse=True):
+    for comp, count in comp_counts.most_common():
         logger.info("  %s: %d", comp, count)
 
-    # Data quality check
-    missing = [fx for fx in results if not (fx.get("home_team") and fx.get("away_team"))]
     completeness = (len(results) - len(missing)) / len(results) * 100 if results else 0
     logger.info(
         "Data quality: %d total | %d missing teams | %.1f%% complete",
@@ -118,13 +132,11 @@ async def run_diagnostics(limit: int | None, enable_debug: bool) -> None:
                 outer = (dbg.get("outerHTML") or "")[:400].replace("\n", " ")
                 logger.debug("  selector=%s outerHTML[0:400]=%s...", selector, outer)
 
-        with open("problematic_fixtures.json", "w", encoding="utf-8") as f:
-            json.dump(missing, f, indent=2, ensure_ascii=False)
+        await _write_json("problematic_fixtures.json", missing)
         logger.info("Saved %d problematic fixtures to problematic_fixtures.json", len(missing))
 
     # Persist full results
-    with open("scraped_fixtures.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    await _write_json("scraped_fixtures.json", results)
     logger.info("Saved all scraped fixtures to scraped_fixtures.json")
 
     await scraper.close()
@@ -134,11 +146,15 @@ async def run_diagnostics(limit: int | None, enable_debug: bool) -> None:
 async def _page_diagnostics():  # pragma: no cover - side-channel
     logger.info("Running low-level page diagnostics ...")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
+        # Only DOM counts and text are inspected; skip images/fonts/styles.
+        async with get_browser_pool().page(block_assets=True) as page:
             target_url = "https://www.courtside1891.basketball/games"
             await page.goto(target_url, timeout=60000, wait_until="domcontentloaded")
+            # Content readiness instead of networkidle; counts are still taken on timeout.
+            try:
+                await page.wait_for_selector("[data-testid],article,section", state="attached", timeout=15000)
+            except Exception:
+                logger.debug("No content marker appeared within 15s")
             ready = await page.evaluate("document.readyState")
             counts = await page.evaluate(
                 """() => ({
@@ -152,7 +168,6 @@ async def _page_diagnostics():  # pragma: no cover - side-channel
             text_sample = (await page.inner_text("body"))[:1000]
             logger.info("document.readyState=%s selector_counts=%s", ready, counts)
             logger.debug("Body sample: %s", text_sample.replace("\n", " ")[:300])
-            await browser.close()
     except Exception:
         logger.exception("Page diagnostics failed")
 
@@ -166,17 +181,19 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+async def _run_and_close(limit: int | None, enable_debug: bool) -> None:
+    try:
+        await run_diagnostics(limit, enable_debug)
+    finally:
+        await close_browser_pool()
+
+
 def main():  # pragma: no cover - CLI entry
     args = parse_args()
     if args.debug:
         os.environ.setdefault("LOG_LEVEL", "DEBUG")
     configure_logging(service="diagnose")
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(run_diagnostics(args.limit, args.debug))
-    finally:
-        loop.close()
+    run(_run_and_close(args.limit, args.debug))
 
 
 if __name__ == "__main__":  # pragma: no cover
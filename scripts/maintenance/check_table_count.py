@@ -1,63 +1,150 @@
-"""Check row count of a given DB table with retries.
+"""Check row counts of DB tables with retries.
 
 Moved into maintenance utilities folder.
 Usage:
-  python scripts/maintenance/check_table_count.py <table_name>
-Defaults to 'live_scores' when not provided.
+  python scripts/maintenance/check_table_count.py [table_name ...] [--exact]
+Defaults to 'live_scores' when not provided. Without --exact the planner's
+row estimate (pg_class.reltuples, falling back to n_live_tup) is reported
+instead of running a full COUNT(*). All tables are checked in one query;
+names resolve through the search_path like an unqualified SELECT would.
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
+import functools
 import os
+import random
+import re
 import sys
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
 import asyncpg  # type: ignore
 from dotenv import load_dotenv  # type: ignore
 
-TABLE = sys.argv[1] if len(sys.argv) > 1 else "live_scores"
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
+from scripts._runner import run  # type: ignore  # noqa: E402
 
+TABLES = ["live_scores"]
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# A full COUNT(*) on a big table can take minutes; the pool's command_timeout
+# (meant for the catalog lookup) would cancel it.
+EXACT_TIMEOUT = 600.0
+# Worth retrying: the DB is not reachable (yet) or the connection dropped.
+# Any other PostgresError (permissions, bad SQL, ...) fails the same way again.
+_TRANSIENT_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.TooManyConnectionsError,
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_dsn() -> str:
+    """DATABASE_URL with any SQLAlchemy driver suffix (``+asyncpg``) dropped from the scheme."""
     dsn = os.getenv("DATABASE_URL", "")
     if not dsn:
         raise RuntimeError("DATABASE_URL not set in environment")
-    return dsn.replace("+asyncpg", "")
+    u = urlsplit(dsn)
+    scheme = u.scheme.split("+", 1)[0]
+    return urlunsplit((scheme, u.netloc, u.path, u.query, u.fragment))
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff (capped at 30s) with a little jitter."""
+    return min(30, 0.5 * 2**attempt) + random.random() * 0.25
+
+
+# Catalog row estimates; reltuples is -1 for tables never analyzed. Only tables
+# visible on the search_path count, and a name present in several schemas
+# resolves to the first one, the same table an unqualified COUNT(*) would read.
+_ESTIMATE_SQL = """
+    SELECT DISTINCT ON (c.relname) c.relname,
+           CASE WHEN c.reltuples >= 0 THEN c.reltuples::bigint ELSE s.n_live_tup END AS n
+    FROM pg_class c
+    JOIN pg_namespace ns ON ns.oid = c.relnamespace
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE c.relname = ANY($1::text[]) AND c.relkind IN ('r', 'p')
+      AND ns.nspname = ANY(current_schemas(false))
+    ORDER BY c.relname, array_position(current_schemas(false), ns.nspname)
+"""
+
+
+async def _estimate(conn, tables: list[str]) -> dict[str, int | None]:
+    # Prepared once per pooled connection (asyncpg caches it), so retries skip parse/plan.
+    stmt = await conn.prepare(_ESTIMATE_SQL)
+    return {r["relname"]: r["n"] for r in await stmt.fetch(tables)}
+
+
+async def _exact(conn, tables: list[str]) -> dict[str, int | None]:
+    # Count only tables the catalog lookup found, so a missing one is reported
+    # as "table not found" like in estimate mode instead of failing the UNION.
+    found = await _estimate(conn, tables)
+    existing = [t for t in tables if t in found]
+    if not existing:
+        return {}
+    # names are validated identifiers; one UNION ALL keeps it a single round-trip
+    query = " UNION ALL ".join(f"SELECT '{t}' AS relname, COUNT(*) AS n FROM {t}" for t in existing)
+    return {r["relname"]: r["n"] for r in await conn.fetch(query, timeout=EXACT_TIMEOUT)}
 
 
-async def check():
+async def check(tables: list[str] | None = None, exact: bool = False):
+    tables = tables or TABLES
+    invalid = [t for t in tables if not _IDENTIFIER.match(t)]
+    if invalid:
+        print(f"Error: invalid table name(s) {invalid!r}")
+        return
     dsn = get_dsn()
     attempts = 10
-    delay = 2
     last_err = None
-    for i in range(1, attempts + 1):
-        try:
-            conn = await asyncpg.connect(dsn)
+    pool = None
+    try:
+        for i in range(attempts):
             try:
-                await conn.fetchval("SELECT 1")
-                cnt = await conn.fetchval(f"SELECT COUNT(*) FROM {TABLE}")
-                print(f"{TABLE} count: {cnt}")
+                # One pool for all attempts; created lazily so a DB that is not
+                # up yet is retried like a dropped connection.
+                if pool is None:
+                    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=1, command_timeout=5)
+                async with pool.acquire() as conn:
+                    if exact:
+                        counts = await _exact(conn, tables)
+                        source = "exact"
+                    else:
+                        counts = await _estimate(conn, tables)
+                        source = "estimate"
+                for table in tables:
+                    if table in counts:
+                        print(f"{table} count: {counts[table]} ({source})")
+                    else:
+                        print(f"{table}: table not found")
                 return
-            finally:
-                await conn.close()
-        except Exception as e:  # pragma: no cover - network/db path
-            last_err = e
-            if i < attempts:
-                await asyncio.sleep(delay)
-            else:
+            except _TRANSIENT_ERRORS as e:  # pragma: no cover - network/db path
+                last_err = e
+                if i < attempts - 1:
+                    await asyncio.sleep(_backoff(i))
+            except asyncpg.PostgresError as e:  # pragma: no cover - network/db path
+                last_err = e
                 break
+    finally:
+        if pool is not None:
+            await pool.close()
     print("Error:", type(last_err).__name__, str(last_err))
 
 
 def main():  # pragma: no cover - CLI entry
-    if sys.platform.startswith("win"):
-        try:
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        except Exception:
-            pass
-    project_root = Path(__file__).resolve().parents[2]
-    load_dotenv(project_root / ".env")
-    asyncio.run(check())
+    parser = argparse.ArgumentParser(description="Check row counts of DB tables")
+    parser.add_argument("tables", nargs="*", default=TABLES)
+    parser.add_argument("--exact", action="store_true", help="run a full SELECT COUNT(*)")
+    args = parser.parse_args()
+    load_dotenv(PROJECT_ROOT / ".env")
+    run(check(args.tables, args.exact))
 
 
 if __name__ == "__main__":  # pragma: no cover
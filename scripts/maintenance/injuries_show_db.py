@@ -28,14 +28,16 @@ try:  # optional dotenv
 except Exception:  # pragma: no cover - optional
     pass
 
+from psycopg2.extras import RealDictCursor  # type: ignore  # noqa: E402
+
 from src.common.db import get_conn  # type: ignore  # noqa: E402
 
 
 def fetch_injuries_for_club_verein_id(club_id: int, limit: int = 50):
     pattern = f"%/verein/{club_id}/%"
-    rows = []
     with get_conn() as conn:
-        with conn.cursor() as cur:
+        # RealDictCursor builds the row dicts while fetching (no tuple + zip pass)
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
                 """
                 SELECT player_id, absence_type, reason, start_date, end_date,
@@ -47,10 +49,7 @@ def fetch_injuries_for_club_verein_id(club_id: int, limit: int = 50):
                 """,
                 (pattern, limit),
             )
-            cols = [d.name for d in cur.description]
-            for r in cur.fetchall():
-                rows.append(dict(zip(cols, r)))
-    return rows
+            return cur.fetchall()
 
 
 def main():  # pragma: no cover - CLI
@@ -2,6 +2,7 @@
 
 Sources (pass via --source):
   bundesliga_overview   - Overview clubs only (legacy scrape_bundesliga_clubs subset)
+  bundesliga_overview_csv - Overview clubs as CSV (one row per club)
   bundesliga_deep       - Clubs + squads + players (legacy run_bundesliga_club_scraper)
   flashscore_once       - Single Flashscore orchestration run
   courtside_preview     - Lightweight Courtside scraper preview (first fixtures)
@@ -9,30 +10,38 @@ Sources (pass via --source):
   tm_injuries_csv       - Transfermarkt injuries (CSV minimal format)
 
 Common options:
-  --out OUT.json        Output file (JSON unless *_csv mode)
+  --out OUT.json        Output file (JSON unless *_csv mode; bundesliga_deep streams *.jsonl/*.ndjson)
   --limit N             Limit items (if supported by the source)
+  --no-cache / --refresh  Bypass / revalidate the on-disk page and club caches in .cache/
   --verbose             Verbose logging
 
 Examples:
   python scripts/run_scraper.py --source bundesliga_overview --out reports/bundesliga_clubs.json
+  python scripts/run_scraper.py --source bundesliga_overview_csv --out reports/bundesliga_clubs.csv
   python scripts/run_scraper.py --source bundesliga_deep --limit 3 --out reports/bundesliga_deep.json
+  python scripts/run_scraper.py --source bundesliga_deep --out reports/bundesliga_deep.ndjson
   python scripts/run_scraper.py --source flashscore_once
   python scripts/run_scraper.py --source courtside_preview --out reports/courtside/preview.json
   python scripts/run_scraper.py --source tm_injuries --club-id 27 --out reports/tm_injuries.json
   python scripts/run_scraper.py --source tm_injuries_csv --club-id 27 > injuries.csv
+  python scripts/run_scraper.py --source tm_injuries --club-ids 27,16,15 --out reports/tm_injuries.json
 """
 from __future__ import annotations
 
 import argparse
 import asyncio
 import csv
-import json
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
+from datetime import date
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
+
+import aiohttp
+import orjson
 
 # Ensure project root
 ROOT = Path(__file__).resolve().parents[1]
@@ -41,52 +50,139 @@ if str(ROOT) not in sys.path:
 
 
 # --- Transfermarkt Injuries minimal helpers (adapted from preview scripts) ---
-from src.common.http import DEFAULT_UAS, fetch_html  # type: ignore
-from src.common.parsing import extract_tm_player_id_from_href  # type: ignore
-from src.data_collection.scrapers.transfermarkt_injuries_scraper import _parse_injuries  # type: ignore
+from scripts._runner import run  # type: ignore
+from src.common import host_gate  # type: ignore
+from src.common.http import DEFAULT_UAS, fetch_html_async, new_async_session  # type: ignore
+from src.common.parsing import extract_tm_player_ids  # type: ignore
+from src.data_collection.scrapers.transfermarkt_injuries_scraper import InjuryRow, _parse_injuries  # type: ignore
 from src.common.logging_utils import configure_logging, get_logger  # NEW
 
 logger = get_logger("scripts.run_scraper")
 
 
+def _dumps(obj: Any) -> bytes:
+    """Indented UTF-8 JSON bytes; non-JSON values (e.g. Decimal) fall back to str()."""
+    return orjson.dumps(
+        obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+# Conditional-GET cache: unchanged injury pages come back as 304 without a body
+_TM_CACHE_DIR = ROOT / ".cache" / "tm"
+# Within the TTL cached pages are used without any request (--refresh bypasses it)
+_TM_CACHE_TTL = 15 * 60
+
+
+# Minimal CSV format keeps fields unquoted: map separators/newlines to spaces in one C-level pass
+_CSV_SANITIZE = str.maketrans({",": " ", "\n": " ", "\r": " "})
+
+
 def _tm_injuries_url(club_id: int) -> str:
     return f"https://www.transfermarkt.de/-/sperrenundverletzungen/verein/{club_id}/plus/1"
 
 
-async def run_tm_injuries(club_id: int, csv_mode: bool, out: Path | None) -> dict[str, Any] | None:
-    html = fetch_html(
-        _tm_injuries_url(club_id),
-        timeout=45.0,
-        retries=3,
-        backoff=1.5,
-        proxy=None,
-        verbose=False,
-        user_agents=DEFAULT_UAS,
-        rotate_ua=False,
-        force_ua_on_429=False,
-        header_randomize=True,
-        pre_jitter=0.0,
-    )
-    rows = _parse_injuries(html)
+async def _fetch_tm_injuries(
+    club_id: int, session: aiohttp.ClientSession, cache: bool = True, refresh: bool = False
+) -> list[InjuryRow]:
+    url = _tm_injuries_url(club_id)
+    async with host_gate.acquire(url):
+        html = await fetch_html_async(
+            url,
+            session=session,
+            timeout=45.0,
+            retries=3,
+            backoff=1.5,
+            user_agents=DEFAULT_UAS,
+            header_randomize=True,
+            etag_cache_dir=_TM_CACHE_DIR if cache else None,
+            cache_ttl=None if refresh else _TM_CACHE_TTL,
+        )
+    return _parse_injuries(html)
+
+
+def _injury_csv_rows(rows: list[InjuryRow]) -> Iterable[list[Any]]:
+    tm_ids = extract_tm_player_ids(r.player_href for r in rows)
+    for tm_id, r in zip(tm_ids, rows):
+        yield [
+            tm_id,
+            (r.player_name or "").translate(_CSV_SANITIZE),
+            (r.reason or "").translate(_CSV_SANITIZE),
+            r.start_date or "",
+            r.end_or_expected or "",
+        ]
+
+
+def write_injuries_csv(by_club: dict[int, list[InjuryRow]], out: Path | None) -> None:
+    """Minimal injuries CSV; a leading club_id column is added when several clubs are written."""
+    multi = len(by_club) > 1
+    if out:
+        out.parent.mkdir(parents=True, exist_ok=True)
+    fh = sys.stdout if out is None else out.open("w", newline="", encoding="utf-8")
+    try:
+        writer = csv.writer(fh)
+        header = ["tm_player_id", "player_name", "reason", "start_date", "expected"]
+        writer.writerow(["club_id", *header] if multi else header)
+        for club_id, rows in by_club.items():
+            writer.writerows([club_id, *row] if multi else row for row in _injury_csv_rows(rows))
+    finally:
+        if out is not None:
+            fh.close()
+
+
+def _injuries_payload(club_id: int, rows: list[InjuryRow]) -> dict[str, Any]:
+    return {"club_id": club_id, "count": len(rows), "items": [r._asdict() for r in rows]}
+
+
+async def run_tm_injuries(
+    club_id: int,
+    csv_mode: bool,
+    out: Path | None,
+    session: aiohttp.ClientSession | None = None,
+    cache: bool = True,
+    refresh: bool = False,
+) -> dict[str, Any] | None:
+    if session is None:
+        async with new_async_session() as own_session:
+            return await run_tm_injuries(club_id, csv_mode, out, own_session, cache, refresh)
+    rows = await _fetch_tm_injuries(club_id, session, cache, refresh)
     if csv_mode:
-        writer = csv.writer(sys.stdout if out is None else out.open("w", newline="", encoding="utf-8"))
-        writer.writerow(["tm_player_id", "player_name", "reason", "start_date", "expected"])
-        for r in rows:
-            writer.writerow([
-                extract_tm_player_id_from_href(r.get("player_href")),
-                (r.get("player_name") or "").replace(",", " "),
-                (r.get("reason") or "").replace(",", " "),
-                r.get("start_date") or "",
-                r.get("end_or_expected") or "",
-            ])
+        write_injuries_csv({club_id: rows}, out)
         return None
-    payload = {"club_id": club_id, "count": len(rows), "items": rows}
+    payload = _injuries_payload(club_id, rows)
     if out:
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        out.write_bytes(_dumps(payload))
     return payload
 
 
+async def run_tm_injuries_batch(
+    club_ids: list[int],
+    csv_mode: bool,
+    out: Path | None,
+    session: aiohttp.ClientSession,
+    cache: bool = True,
+    refresh: bool = False,
+) -> dict[str, Any] | None:
+    """Several clubs in one process on one session; host_gate bounds the fan-out per host."""
+
+    async def one(cid: int) -> list[InjuryRow]:
+        try:
+            return await _fetch_tm_injuries(cid, session, cache, refresh)
+        except Exception as e:  # one failing club should not drop the others
+            logger.warning("Injuries for club %s failed: %s", cid, e)
+            return []
+
+    by_club = dict(zip(club_ids, await asyncio.gather(*(one(cid) for cid in club_ids))))
+    if csv_mode:
+        write_injuries_csv(by_club, out)
+        return None
+    merged = {"clubs": {cid: _injuries_payload(cid, rows) for cid, rows in by_club.items()}}
+    if out:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(_dumps(merged))
+    return merged
+
+
 # --- Flashscore orchestrated run ---
 async def run_flashscore_once(limit: int | None) -> dict[str, Any]:
     from src.apps.sports_data_app import SportsDataApp  # type: ignore
@@ -134,7 +230,10 @@ async def run_courtside_preview(limit: int | None) -> dict[str, Any]:
 
 
 # --- Bundesliga overview & deep ---
-from src.data_collection.scrapers.bundesliga.bundesliga_club_scraper import BundesligaClubScraper  # type: ignore
+from src.data_collection.scrapers.bundesliga.bundesliga_club_scraper import (  # type: ignore
+    BundesligaClubScraper,
+    EnhancedClub,
+)
 
 
 class _MockDB:
@@ -142,65 +241,226 @@ class _MockDB:
         return None
 
 
-async def run_bundesliga_deep(limit_clubs: int | None, limit_players: int | None) -> dict[str, Any]:
+_CLUBS_CACHE_DIR = ROOT / ".cache" / "bundesliga"
+
+
+def _clubs_cache_path() -> Path:
+    return _CLUBS_CACHE_DIR / f"clubs_{date.today().isoformat()}.json"
+
+
+def _load_cached_clubs(cache: bool = True, refresh: bool = False) -> list[EnhancedClub] | None:
+    path = _clubs_cache_path()
+    if not cache or refresh or not path.exists():
+        return None
+    logger.info("Using cached clubs from %s", path)
+    return [EnhancedClub.model_validate(d) for d in orjson.loads(path.read_bytes())]
+
+
+def _store_clubs(clubs: list[EnhancedClub], cache: bool = True) -> None:
+    if cache and clubs:
+        path = _clubs_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps([c.model_dump(mode="json") for c in clubs]))
+
+
+async def _scrape_clubs_cached(
+    scraper: BundesligaClubScraper, cache: bool = True, refresh: bool = False
+) -> list[EnhancedClub]:
+    """scrape_clubs() memoized per calendar day in .cache/bundesliga (club pages rarely change)."""
+    clubs = _load_cached_clubs(cache, refresh)
+    if clubs is None:
+        clubs = await scraper.scrape_clubs()
+        _store_clubs(clubs, cache)
+    return clubs
+
+
+@asynccontextmanager
+async def _bundesliga_scraper(concurrency: int | None = None) -> AsyncIterator[BundesligaClubScraper]:
+    """One initialized scraper (and thus one keep-alive session) for a whole run, closed afterwards."""
     scraper = BundesligaClubScraper(_MockDB())
+    if concurrency:
+        scraper.config.max_concurrency = concurrency
     await scraper.initialize()
-    clubs = await scraper.scrape_clubs()
-    logger.info("Fetched %d clubs (pre-limit)", len(clubs))
-    if limit_clubs:
-        clubs = clubs[:limit_clubs]
-        logger.debug("Applied club limit -> %d", len(clubs))
-    results: dict[str, Any] = {"clubs": [c.model_dump() for c in clubs], "players": {}, "squads": {}}
-    if limit_players is not None and limit_players <= 0:
-        return results
-    for club in clubs:
-        squad = await scraper.scrape_squad(club)
-        if limit_players:
-            squad = squad[:limit_players]
-        results["squads"][club.slug] = [p.model_dump() for p in squad]
-        for p in squad:
-            pdata = await scraper.scrape_player(p, club)
-            results["players"][p.slug] = pdata.model_dump()
-    return results
+    try:
+        yield scraper
+    finally:
+        await scraper.cleanup()
+
+
+async def run_bundesliga_deep(
+    limit_clubs: int | None,
+    limit_players: int | None,
+    concurrency: int | None = None,
+    cache: bool = True,
+    refresh: bool = False,
+    stream_to: Path | None = None,
+) -> dict[str, Any] | None:
+    async with _bundesliga_scraper(concurrency) as scraper:
+        clubs = await _scrape_clubs_cached(scraper, cache, refresh)
+        logger.info("Fetched %d clubs (pre-limit)", len(clubs))
+        if limit_clubs:
+            clubs = clubs[:limit_clubs]
+            logger.debug("Applied club limit -> %d", len(clubs))
+        squads: dict[str, list[str]] = {}
+        if limit_players is None or limit_players > 0:
+            squads = await scraper.scrape_squads(clubs)
+            if limit_players:
+                squads = {name: links[:limit_players] for name, links in squads.items()}
+        if stream_to is not None:
+            await _stream_deep_records(scraper, clubs, squads, stream_to)
+            return None
+        players = await scraper.scrape_players(squads) if squads else {}
+    return {
+        "clubs": [c.model_dump(mode="json") for c in clubs],
+        "players": {name: [p.model_dump(mode="json") for p in ps] for name, ps in players.items()},
+        "squads": squads,
+    }
+
+
+# bundesliga_deep output files with these suffixes are streamed one club per line
+_LINE_SUFFIXES = (".jsonl", ".ndjson")
+
+
+async def _stream_deep_records(
+    scraper: BundesligaClubScraper, clubs: list[EnhancedClub], squads: dict[str, list[str]], out: Path
+) -> None:
+    """Write one JSON line per club as soon as its players are scraped.
+
+    Clubs are processed one after another (players within a club still run at
+    ``max_concurrency``), so only a single squad is held in memory and consumers can
+    tail the file while the scrape is running.
+    """
+    out.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with out.open("wb") as f:
+        for club in clubs:
+            links = squads.get(club.name, [])
+            players = (await scraper.scrape_players({club.name: links})).get(club.name, []) if links else []
+            record = {
+                "club": club.model_dump(mode="json"),
+                "squad": links,
+                "players": [p.model_dump(mode="json") for p in players],
+            }
+            f.write(orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE))
+            f.flush()
+            written += len(players)
+    logger.info("Streamed %d clubs / %d players to %s", len(clubs), written, out)
 
 
 # For overview we reuse separate script logic? If that script has custom heuristics, consider importing.
 # Here we call only the scraper's clubs method; the older script did parsing without dynamic player detail.
-async def run_bundesliga_overview(limit: int | None) -> dict[str, Any]:
-    scraper = BundesligaClubScraper(_MockDB())
-    await scraper.initialize()
-    clubs = await scraper.scrape_clubs()
+async def run_bundesliga_overview(
+    limit: int | None,
+    csv_mode: bool = False,
+    out: Path | None = None,
+    cache: bool = True,
+    refresh: bool = False,
+) -> dict[str, Any] | None:
+    # A cache hit needs no scraper at all (no session, no browser)
+    clubs = _load_cached_clubs(cache, refresh)
+    if clubs is None:
+        async with _bundesliga_scraper() as scraper:
+            clubs = await scraper.scrape_clubs()
+        _store_clubs(clubs, cache)
     if limit:
         clubs = clubs[:limit]
     logger.info("Bundesliga overview returning %d clubs", len(clubs))
-    return {"count": len(clubs), "clubs": [c.model_dump() for c in clubs]}
+    if csv_mode:
+        write_clubs_csv(clubs, out)
+        return None
+    return {"count": len(clubs), "clubs": [c.model_dump(mode="json") for c in clubs]}
+
+
+def write_clubs_csv(clubs: list[EnhancedClub], out: Path | None) -> None:
+    """Stream clubs as CSV; the header is the model schema, so rows need no pre-scan."""
+    if out:
+        out.parent.mkdir(parents=True, exist_ok=True)
+    fh = sys.stdout if out is None else out.open("w", newline="", encoding="utf-8")
+    try:
+        header = list(EnhancedClub.model_fields)
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        # Positional rows in one writerows call; no per-row DictWriter field mapping
+        writer.writerows([row.get(k) for k in header] for row in (c.model_dump(mode="json") for c in clubs))
+    finally:
+        if out is not None:
+            fh.close()
 
 
 # --- Argument parsing & orchestration ---
+def _parse_club_ids(value: str) -> list[int]:
+    try:
+        ids = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {value!r}")
+    if not ids:
+        raise argparse.ArgumentTypeError("no club ids given")
+    return list(dict.fromkeys(ids))
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Unified multi-source scraping CLI")
     p.add_argument("--source", required=True, choices=[
-        "bundesliga_overview","bundesliga_deep","flashscore_once","courtside_preview","tm_injuries","tm_injuries_csv"
+        "bundesliga_overview","bundesliga_overview_csv","bundesliga_deep","flashscore_once","courtside_preview","tm_injuries","tm_injuries_csv"
     ])
     p.add_argument("--out", type=str, default=None, help="Output file (JSON unless *_csv)")
     p.add_argument("--limit", type=int, default=None, help="Generic limit (clubs, fixtures, etc.)")
     p.add_argument("--limit-players", type=int, default=None, help="Limit players per club (deep mode)")
+    p.add_argument(
+        "--squad-concurrency", type=int, default=None, help="Parallel squad/player fetches (deep mode, default 4)"
+    )
     p.add_argument("--club-id", type=int, default=27, help="Transfermarkt club id for injuries")
+    p.add_argument(
+        "--club-ids", type=_parse_club_ids, default=None, help="Comma-separated club ids (injuries, one run)"
+    )
+    p.add_argument("--no-cache", dest="cache", action="store_false", help="Do not read or write .cache/")
+    p.add_argument("--refresh", action="store_true", help="Ignore cache TTLs (pages are still revalidated)")
     p.add_argument("--verbose", action="store_true")
     return p
 
 
 async def dispatch(args: argparse.Namespace) -> Any:
     if args.source.startswith("tm_injuries"):
-        return await run_tm_injuries(args.club_id, csv_mode=args.source.endswith("_csv"), out=(Path(args.out) if args.out else None))
+        async with new_async_session() as session:
+            if args.club_ids and len(args.club_ids) > 1:
+                return await run_tm_injuries_batch(
+                    args.club_ids,
+                    csv_mode=args.source.endswith("_csv"),
+                    out=(Path(args.out) if args.out else None),
+                    session=session,
+                    cache=args.cache,
+                    refresh=args.refresh,
+                )
+            return await run_tm_injuries(
+                args.club_ids[0] if args.club_ids else args.club_id,
+                csv_mode=args.source.endswith("_csv"),
+                out=(Path(args.out) if args.out else None),
+                session=session,
+                cache=args.cache,
+                refresh=args.refresh,
+            )
     if args.source == "flashscore_once":
         return await run_flashscore_once(args.limit)
     if args.source == "courtside_preview":
         return await run_courtside_preview(args.limit)
     if args.source == "bundesliga_deep":
-        return await run_bundesliga_deep(args.limit, args.limit_players)
-    if args.source == "bundesliga_overview":
-        return await run_bundesliga_overview(args.limit)
+        out = Path(args.out) if args.out else None
+        return await run_bundesliga_deep(
+            args.limit,
+            args.limit_players,
+            args.squad_concurrency,
+            cache=args.cache,
+            refresh=args.refresh,
+            stream_to=out if out is not None and out.suffix in _LINE_SUFFIXES else None,
+        )
+    if args.source.startswith("bundesliga_overview"):
+        return await run_bundesliga_overview(
+            args.limit,
+            csv_mode=args.source.endswith("_csv"),
+            out=(Path(args.out) if args.out else None),
+            cache=args.cache,
+            refresh=args.refresh,
+        )
     raise SystemExit("Unknown source")
 
 
@@ -209,7 +469,7 @@ def maybe_write_json(result: Any, out: str | None):
         return
     path = Path(out)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(result, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    path.write_bytes(_dumps(result))
 
 
 def main(argv: list[str] | None = None):
@@ -220,12 +480,12 @@ def main(argv: list[str] | None = None):
         os.environ.setdefault("LOG_LEVEL", "DEBUG")  # ensure verbose effect
     configure_logging(service="scraper")
     logger.info("Starting scraper with source=%s", args.source)
-    result = asyncio.run(dispatch(args))
+    result = run(dispatch(args))
     if args.out and not (args.source.endswith("_csv")):
         maybe_write_json(result, args.out)
         logger.info("Wrote output to %s", args.out)
     if result is not None and not args.out:
-        print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+        sys.stdout.buffer.write(_dumps(result))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
-# Automatically add the project's src/ directory to sys.path for local execution of scripts
+# Automatically add the project root and its src/ directory to sys.path for local execution
+# of scripts, so `src.*` / `scripts.*` imports resolve without per-script path bootstrapping
 import os
 import sys
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 if os.path.isdir(SRC_PATH) and SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
@@ -4,13 +4,13 @@ Clubs API Endpoints
 - Liefert Clubs aus verschiedenen Ligen (z.B. Bundesliga, Premier League, etc.)
 """
 
-import json
 import os
 import time
 
 from pathlib import Path
 from typing import Any, Optional, Literal
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
 
 from src.api.models import APIResponse
@@ -38,21 +38,21 @@ def _load_clubs(league: str) -> list[dict[str, Any]]:
     path = _get_json_path(league)
     if not path.exists():
         raise FileNotFoundError(f"Not found: {path}")
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-        # fbref: clubs liegen unter "items"
-        if isinstance(data, dict) and "items" in data:
-            data = data["items"]
-        if not isinstance(data, list):
-            raise ValueError("Invalid data format: expected a list of clubs")
-        validated: list[dict[str, Any]] = []
-        for item in data:
-            try:
-                club = Club(**item)
-                validated.append(club.model_dump())
-            except Exception as e:
-                raise ValueError(f"Invalid club entry: {e}")
-        return validated
+    # orjson parst direkt aus den Bytes, ohne vorheriges UTF-8 Decoding in einen str
+    data = orjson.loads(path.read_bytes())
+    # fbref: clubs liegen unter "items"
+    if isinstance(data, dict) and "items" in data:
+        data = data["items"]
+    if not isinstance(data, list):
+        raise ValueError("Invalid data format: expected a list of clubs")
+    validated: list[dict[str, Any]] = []
+    for item in data:
+        try:
+            club = Club(**item)
+            validated.append(club.model_dump())
+        except Exception as e:
+            raise ValueError(f"Invalid club entry: {e}")
+    return validated
 
 
 
@@ -2,9 +2,26 @@
 Applications Package für die Sport Data Pipeline
 
 Enthält Hauptanwendungsklassen für verschiedene Komponenten.
+Die Klassen werden erst beim ersten Zugriff importiert, damit z.B. ein reiner
+Collection-Lauf die Analytics-Abhängigkeiten (scikit-learn etc.) nicht lädt.
 """
 
-from .analytics_app import SportsAnalyticsApp
-from .sports_data_app import SportsDataApp
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .analytics_app import SportsAnalyticsApp
+    from .sports_data_app import SportsDataApp
+
+_LAZY_EXPORTS = {
+    "SportsDataApp": ".sports_data_app",
+    "SportsAnalyticsApp": ".analytics_app",
+}
 
 __all__ = ["SportsDataApp", "SportsAnalyticsApp"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,60 @@ Entity Mapping Service to resolve and map entities from different data sources.
 Includes a manual review queue for uncertain matches.
 """
 
-import json
+import asyncio
+import logging
+import re
+import threading
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
-from thefuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from unidecode import unidecode
 
 # Assume DatabaseManager is in src.database.manager
 # from src.database.manager import DatabaseManager
 
 
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+# Legal-form tokens that carry no identity ("FC Bayern" vs "Bayern")
+_STOPWORD_TOKENS = frozenset({"fc", "ac", "afc", "cf", "sc", "sv", "club"})
+
+
+def _normalize(value: Any) -> str:
+    """
+    Normalizes a value for fuzzy comparison: transliterated to ASCII, lowercased,
+    punctuation and stopword tokens removed, tokens sorted. fuzz.ratio on the result
+    behaves like token_sort_ratio ("Bayern Munchen FC" == "FC Bayern München").
+    Exonyms are not resolved: "Bayern Munich" vs "Bayern München" still scores ~89.
+    """
+    if value is None:
+        return ""
+    tokens = _NON_ALNUM.sub(" ", unidecode(str(value)).lower()).split()
+    kept = [token for token in tokens if token not in _STOPWORD_TOKENS] or tokens
+    return " ".join(sorted(kept))
+
+
+def _merge_external_id_query(table: str) -> str:
+    """
+    UPDATE adding {source_name: source_id} to external_ids.
+
+    Params: $1 row id, $2 source name, $3 source id. The text is constant per table,
+    so asyncpg's statement cache reuses the prepared plan.
+    """
+    return f"""
+        UPDATE {table}
+        SET external_ids = COALESCE(external_ids, '{{}}'::jsonb)
+            || jsonb_build_object($2::text, $3::text)
+        WHERE id = $1;
+    """
+
+
+def _candidate_matches(candidates: list[tuple[int, float]]) -> list[dict]:
+    """Ranked (id, score) pairs in the shape of the candidate_matches review column."""
+    return [{"id": match_id, "score": round(score, 2)} for match_id, score in candidates]
+
+
 class EntityMapper:
     """
     Handles entity resolution, including a review queue for uncertain matches.
@@ -19,68 +64,256 @@ class EntityMapper:
 
     def __init__(self, db_manager: Any):
         self.db_manager = db_manager
+        self.logger = logging.getLogger(__name__)
         # High confidence threshold for automatic matching
         self.MATCH_THRESHOLD = 90
         # Lower threshold to flag an entity for manual review
         self.REVIEW_THRESHOLD = 75  # Anything between 75 and 90 will be reviewed
+        # Number of ranked candidates stored with each review queue entry
+        self.REVIEW_CANDIDATES = 3
+        # Upper bound for candidates returned by the trigram prefilter
+        self.CANDIDATE_LIMIT = 50
+        # Bounded LRU of fuzzy scores keyed by (normalized_query, normalized_candidate)
+        self.SIMILARITY_CACHE_SIZE = 4096
+        self._similarity_cache: dict[tuple[str, str], int] = {}
+        self._similarity_lock = threading.Lock()
+        # Candidate blocks per query, tagged with the entity type's version counter
+        self.CANDIDATE_CACHE_SIZE = 1024
+        self._candidate_cache: dict[tuple, tuple[int, list[dict]]] = {}
+        self._versions: dict[str, int] = {}
 
         self.strategies = {
             "team": {
                 "table": "teams",
                 "match_fields": ["name", "country_id"],
                 "fuzzy_fields": ["name"],
+                # Exact predicates used to narrow candidates in SQL (blocking)
+                "blocking_fields": ["country_id"],
+                # Column with a pg_trgm index (see migration 0003)
+                "trigram_field": "name",
             },
             "player": {
                 "table": "players",
                 "match_fields": ["last_name", "first_name", "birth_date"],
                 "fuzzy_fields": ["first_name", "last_name"],
+                "blocking_fields": ["birth_date"],
+                "trigram_field": "last_name",
             },
             # ... other strategies
         }
 
+    def _blocking_conditions(
+        self, strategy: dict, new_entity_data: dict, params: list[Any]
+    ) -> tuple[list[str], int | None]:
+        """
+        Builds the WHERE predicates of a strategy's candidate block, appending their
+        values to params. Returns the predicates and the parameter index of the
+        trigram value (None when it is unknown).
+        """
+        conditions: list[str] = []
+
+        for field in strategy.get("blocking_fields", []):
+            value = new_entity_data.get(field)
+            if value is None:
+                continue  # Unknown value cannot narrow the block
+            params.append(value)
+            conditions.append(f"{field} = ${len(params)}")
+
+        trigram_field = strategy.get("trigram_field")
+        trigram_value = new_entity_data.get(trigram_field) if trigram_field else None
+        if trigram_value is None:
+            return conditions, None
+        params.append(str(trigram_value))
+        conditions.append(f"{trigram_field} % ${len(params)}")
+        return conditions, len(params)
+
+    def _build_candidate_query(self, strategy: dict, new_entity_data: dict) -> tuple[str, list]:
+        """
+        Builds the blocking query for a strategy.
+
+        Exact blocking fields become equality predicates and the trigram field is
+        prefiltered with pg_trgm's `%` operator, so only a small candidate block
+        is transferred and fuzzy-scored instead of the whole table.
+        """
+        columns = ", ".join(strategy["match_fields"])
+        params: list[Any] = []
+        conditions, trigram_param = self._blocking_conditions(strategy, new_entity_data, params)
+
+        order_clause = ""
+        if trigram_param is not None:
+            order_clause = (
+                f" ORDER BY similarity({strategy['trigram_field']}, ${trigram_param}) DESC"
+            )
+            params.append(self.CANDIDATE_LIMIT)
+            order_clause += f" LIMIT ${len(params)}"
+
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT id, {columns} FROM {strategy['table']}{where_clause}{order_clause};"
+        return query, params
+
+    def invalidate(self, entity_type: str) -> None:
+        """Marks cached candidates of an entity type as stale (e.g. after external writes)."""
+        self._versions[entity_type] = self._versions.get(entity_type, 0) + 1
+
+    async def _cached_fetch(
+        self,
+        entity_type: str,
+        query: str,
+        params: list[Any],
+        prepare: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict]:
+        """
+        Runs a candidate query, served from cache while no row of the entity type
+        has been inserted since it was fetched. `prepare` runs once per fetch.
+        """
+        key = (query, *params)
+        version = self._versions.get(entity_type, 0)
+
+        cached = self._candidate_cache.pop(key, None)
+        if cached is not None and cached[0] == version:
+            self._candidate_cache[key] = cached  # Re-insert to mark as recently used
+            return cached[1]
+
+        rows = await self.db_manager.execute_query(query, *params)
+        if prepare:
+            prepare(rows)
+        self._candidate_cache[key] = (version, rows)
+        while len(self._candidate_cache) > self.CANDIDATE_CACHE_SIZE:
+            del self._candidate_cache[next(iter(self._candidate_cache))]
+        return rows
+
+    async def _fetch_candidates(
+        self, entity_type: str, strategy: dict, new_entity_data: dict
+    ) -> list[dict]:
+        """Returns the (cached) candidate block for new_entity_data."""
+
+        def normalize_rows(rows: list[dict]) -> None:
+            # Normalize fuzzy fields once per fetch so scoring never re-processes candidates
+            for row in rows:
+                for field in strategy["fuzzy_fields"]:
+                    row[f"_norm_{field}"] = _normalize(row.get(field))
+
+        query, params = self._build_candidate_query(strategy, new_entity_data)
+        return await self._cached_fetch(entity_type, query, params, normalize_rows)
+
+    def _similarity_scores(self, query: str, choices: list[str]) -> np.ndarray:
+        """
+        Returns fuzz.ratio scores of query against choices, reusing cached pairs.
+
+        Only cache misses are sent to RapidFuzz; repeated feeds mostly hit the cache.
+        """
+        cache = self._similarity_cache
+        scores = np.empty(len(choices), dtype=np.uint8)
+        missing: list[int] = []
+
+        # Scoring runs in worker threads; the lock guards the cache, not cdist
+        with self._similarity_lock:
+            for index, choice in enumerate(choices):
+                score = cache.pop((query, choice), None)
+                if score is None:
+                    missing.append(index)
+                else:
+                    cache[(query, choice)] = score  # Re-insert to mark as recently used
+                    scores[index] = score
+
+        if missing:
+            computed = process.cdist(
+                [query],
+                [choices[index] for index in missing],
+                scorer=fuzz.ratio,
+                workers=-1,
+                dtype=np.uint8,
+            )[0]
+            scores[missing] = computed
+            with self._similarity_lock:
+                for index, score in zip(missing, computed):
+                    cache[(query, choices[index])] = int(score)
+                while len(cache) > self.SIMILARITY_CACHE_SIZE:
+                    del cache[next(iter(cache))]  # Evict least recently used
+
+        return scores
+
     async def _find_best_match(
         self, entity_type: str, new_entity_data: dict
     ) -> tuple[int | None, float]:
         """
         Finds the best matching record and returns its ID and confidence score.
         """
-        strategy = self.strategies[entity_type]
-        table = strategy["table"]
-
-        query = f"SELECT id, {', '.join(strategy['match_fields'])} FROM {table};"
-        all_entities = await self.db_manager.execute_query(query)
+        matches = await self._find_top_matches(entity_type, new_entity_data, limit=1)
+        return matches[0] if matches else (None, 0.0)
 
-        best_match_id = None
-        highest_score = 0.0
+    async def _find_top_matches(
+        self, entity_type: str, new_entity_data: dict, limit: int
+    ) -> list[tuple[int, float]]:
+        """
+        Returns up to `limit` (ID, confidence score) pairs, best first.
+        Candidates with a score of 0 are never returned.
+        """
+        strategy = self.strategies[entity_type]
 
-        for existing_entity in all_entities:
-            # Calculate a score based on all fields
-            total_similarity = 0
-            field_count = len(strategy["match_fields"])
+        all_entities = await self._fetch_candidates(entity_type, strategy, new_entity_data)
 
-            for field in strategy["match_fields"]:
-                new_value = new_entity_data.get(field)
-                existing_value = existing_entity.get(field)
+        if not all_entities:
+            return []
 
-                if new_value is None or existing_value is None:
-                    continue  # Or handle differently
+        # Short-circuit: an identical record scores 100 without any fuzzy scoring.
+        # It always ranks first by trigram similarity, so it is part of the block.
+        match_fields = strategy["match_fields"]
+        if all(new_entity_data.get(field) is not None for field in match_fields):
+            for entity in all_entities:
+                if all(entity.get(field) == new_entity_data[field] for field in match_fields):
+                    return [(entity["id"], 100.0)]
 
-                if field in strategy["fuzzy_fields"]:
-                    total_similarity += fuzz.ratio(
-                        str(new_value).lower(), str(existing_value).lower()
-                    )
-                else:
-                    if new_value == existing_value:
-                        total_similarity += 100  # Perfect match for exact fields
+        # CPU-bound scoring runs in a worker thread (RapidFuzz releases the GIL)
+        return await asyncio.to_thread(
+            self._score_candidates, strategy, new_entity_data, all_entities, limit
+        )
 
-            # Average score across all fields
-            current_score = total_similarity / field_count if field_count > 0 else 0
+    def _score_candidates(
+        self, strategy: dict, new_entity_data: dict, all_entities: list[dict], limit: int
+    ) -> list[tuple[int, float]]:
+        """Scores a candidate block and returns up to `limit` (ID, score) pairs, best first."""
+        # Score every candidate at once: one row of the total per candidate
+        field_count = len(strategy["match_fields"])
+        totals = np.zeros(len(all_entities), dtype=np.float64)
+
+        for field in strategy["match_fields"]:
+            new_value = new_entity_data.get(field)
+            if new_value is None:
+                continue  # Or handle differently
+
+            existing_values = [entity.get(field) for entity in all_entities]
+            present = np.fromiter(
+                (value is not None for value in existing_values),
+                dtype=bool,
+                count=len(existing_values),
+            )
 
-            if current_score > highest_score:
-                highest_score = current_score
-                best_match_id = existing_entity["id"]
+            if field in strategy["fuzzy_fields"]:
+                query = _normalize(new_value)
+                choices = [entity[f"_norm_{field}"] for entity in all_entities]
+                scores = self._similarity_scores(query, choices)
+                totals += np.where(present, scores, 0)
+            else:
+                exact = np.fromiter(
+                    (value == new_value for value in existing_values),
+                    dtype=bool,
+                    count=len(existing_values),
+                )
+                totals += np.where(present & exact, 100, 0)  # Perfect match for exact fields
+
+        # Average score across all fields
+        if field_count > 0:
+            totals /= field_count
+
+        if limit == 1:
+            top = np.array([np.argmax(totals)])
+        else:
+            # Partial selection of the K best, then order only those (ties keep input order)
+            top = np.argpartition(-totals, min(limit, len(totals)) - 1)[:limit]
+            top = top[np.lexsort((top, -totals[top]))]
 
-        return best_match_id, highest_score
+        return [(all_entities[i]["id"], float(totals[i])) for i in top if totals[i] > 0]
 
     async def _log_for_review(
         self,
@@ -89,23 +322,29 @@ class EntityMapper:
         new_entity_data: dict,
         potential_match_id: int,
         score: float,
+        candidates: list[tuple[int, float]] | None = None,
     ):
-        """Logs an uncertain match into the review queue table."""
+        """Logs an uncertain match (and the runner-up candidates) into the review queue table."""
         query = """
                 INSERT INTO mapping_review_queue
-                (entity_type, source_name, new_entity_data, potential_match_id, confidence_score)
-                VALUES ($1, $2, $3, $4, $5); \
+                (entity_type, source_name, new_entity_data, potential_match_id, confidence_score,
+                 candidate_matches)
+                VALUES ($1, $2, $3, $4, $5, $6); \
                 """
         await self.db_manager.execute_query(
             query,
             entity_type,
             source_name,
-            json.dumps(new_entity_data, default=str),  # Serialize data to JSON string
+            new_entity_data,  # Encoded by the jsonb codec of DatabaseManager
             potential_match_id,
             score,
+            _candidate_matches(candidates or [(potential_match_id, score)]),
         )
-        print(
-            f"Logged uncertain match for {entity_type} from '{source_name}' for review. Score: {score:.2f}"
+        self.logger.info(
+            "Logged uncertain match for %s from '%s' for review. Score: %.2f",
+            entity_type,
+            source_name,
+            score,
         )
 
     async def find_or_create(
@@ -115,18 +354,18 @@ class EntityMapper:
         Processes an entity: matches, creates, or sends to review queue.
         Returns the internal ID if resolved, otherwise None.
         """
-        match_id, score = await self._find_best_match(entity_type, new_entity_data)
+        matches = await self._find_top_matches(
+            entity_type, new_entity_data, limit=self.REVIEW_CANDIDATES
+        )
+        match_id, score = matches[0] if matches else (None, 0.0)
 
         if match_id and score >= self.MATCH_THRESHOLD:
             # Case 1: High confidence match -> Merge automatically
-            print(f"Confident match found (Score: {score:.2f}). Merging...")
+            self.logger.info("Confident match found (Score: %.2f). Merging...", score)
             table = self.strategies[entity_type]["table"]
-            update_query = f"""
-                UPDATE {table}
-                SET external_ids = jsonb_set(COALESCE(external_ids, '{{}}'), '{{{source_name}}}', '"{source_id}"', true)
-                WHERE id = $1;
-            """
-            await self.db_manager.execute_query(update_query, match_id)
+            await self.db_manager.execute_query(
+                _merge_external_id_query(table), match_id, source_name, source_id
+            )
             return match_id
 
         elif match_id and score >= self.REVIEW_THRESHOLD:
@@ -137,34 +376,143 @@ class EntityMapper:
                 {**new_entity_data, "source_id": source_id},
                 match_id,
                 score,
+                matches,
             )
             return None  # Not resolved yet
 
         else:
             # Case 3: No confident match -> Create a new record
-            print(f"No match found (Best score: {score:.2f}). Creating new record.")
+            self.logger.info("No match found (Best score: %.2f). Creating new record.", score)
             table = self.strategies[entity_type]["table"]
-            new_entity_data["external_ids"] = json.dumps({source_name: source_id})
+            new_entity_data["external_ids"] = {source_name: source_id}
 
             columns = ", ".join(new_entity_data.keys())
             placeholders = ", ".join([f"${i + 1}" for i in range(len(new_entity_data))])
 
             insert_query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) RETURNING id;"
             new_id = await self.db_manager.execute_insert(insert_query, *new_entity_data.values())
+            # Merges only touch external_ids, so inserts are the only writes that
+            # change candidate blocks
+            self.invalidate(entity_type)
             return new_id
 
+    async def find_or_create_many(
+        self, entity_type: str, items: list[tuple[dict, str]], source_name: str
+    ) -> list[int | None]:
+        """
+        Bulk variant of find_or_create for ingesting a whole feed.
+
+        Args:
+            entity_type: Key of the matching strategy ('team', 'player', ...).
+            items: (new_entity_data, source_id) pairs from one source.
+            source_name: Name of the data source.
+
+        Returns the internal IDs in input order (None for items sent to review).
+        Items are classified first, then merges, review entries and creates are
+        each written in one batch over a single connection. Items within one
+        batch are not matched against each other.
+        """
+        table = self.strategies[entity_type]["table"]
+        results: list[int | None] = [None] * len(items)
+        merges: list[tuple[int, str, str]] = []
+        reviews: list[tuple] = []
+        creates: dict[tuple[str, ...], list[tuple[int, tuple]]] = {}
+
+        for index, (new_entity_data, source_id) in enumerate(items):
+            matches = await self._find_top_matches(
+                entity_type, new_entity_data, limit=self.REVIEW_CANDIDATES
+            )
+            match_id, score = matches[0] if matches else (None, 0.0)
+            if match_id and score >= self.MATCH_THRESHOLD:
+                results[index] = match_id
+                merges.append((match_id, source_name, source_id))
+            elif match_id and score >= self.REVIEW_THRESHOLD:
+                review_data = {**new_entity_data, "source_id": source_id}
+                reviews.append(
+                    (
+                        entity_type,
+                        source_name,
+                        review_data,
+                        match_id,
+                        score,
+                        _candidate_matches(matches),
+                    )
+                )
+            else:
+                row = {**new_entity_data, "external_ids": {source_name: source_id}}
+                creates.setdefault(tuple(row.keys()), []).append((index, tuple(row.values())))
+
+        async with self.db_manager.get_async_connection() as conn:
+            if merges:
+                await conn.executemany(_merge_external_id_query(table), merges)
+            if reviews:
+                await conn.executemany(
+                    """
+                    INSERT INTO mapping_review_queue
+                    (entity_type, source_name, new_entity_data, potential_match_id, confidence_score,
+                     candidate_matches)
+                    VALUES ($1, $2, $3, $4, $5, $6);
+                    """,
+                    reviews,
+                )
+            for columns, rows in creates.items():
+                # One multi-row INSERT per column layout, chunked below Postgres' parameter cap
+                chunk_size = max(1, 32767 // len(columns))
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start : start + chunk_size]
+                    values_sql = ", ".join(
+                        "("
+                        + ", ".join(
+                            f"${n * len(columns) + i + 1}" for i in range(len(columns))
+                        )
+                        + ")"
+                        for n in range(len(chunk))
+                    )
+                    new_ids = await conn.fetch(
+                        f"INSERT INTO {table} ({', '.join(columns)}) "
+                        f"VALUES {values_sql} RETURNING id;",
+                        *(value for _, values in chunk for value in values),
+                    )
+                    for (index, _), record in zip(chunk, new_ids):
+                        results[index] = record["id"]
+
+        if creates:
+            self.invalidate(entity_type)
+        self.logger.info(
+            "Bulk mapped %d %s records: %d merged, %d queued for review, %d created.",
+            len(items),
+            entity_type,
+            len(merges),
+            len(reviews),
+            sum(map(len, creates.values())),
+        )
+        return results
+
     # --- Methods for Manual Review Process ---
 
-    async def get_pending_reviews(self, entity_type: str | None = None) -> list[dict]:
-        """Fetches all pending review items from the queue."""
-        query = "SELECT * FROM mapping_review_queue WHERE status = 'pending'"
+    async def iter_pending_reviews(
+        self, entity_type: str | None = None, prefetch: int = 500
+    ) -> AsyncIterator[dict]:
+        """
+        Streams pending review items from the queue via a server-side cursor,
+        fetching `prefetch` rows per round-trip instead of the whole queue.
+        """
+        query = "SELECT * FROM mapping_review_queue WHERE review_status = 'pending'"
         params = []
         if entity_type:
             query += " AND entity_type = $1"
             params.append(entity_type)
         query += " ORDER BY created_at;"
 
-        return await self.db_manager.execute_query(query, *params)
+        async with self.db_manager.get_async_connection() as conn:
+            # asyncpg cursors require a transaction
+            async with conn.transaction():
+                async for record in conn.cursor(query, *params, prefetch=prefetch):
+                    yield dict(record)
+
+    async def get_pending_reviews(self, entity_type: str | None = None) -> list[dict]:
+        """Fetches all pending review items from the queue."""
+        return [item async for item in self.iter_pending_reviews(entity_type)]
 
     async def resolve_review_item(
         self, review_id: int, decision: str, target_id: int | None = None
@@ -178,7 +526,9 @@ class EntityMapper:
             target_id: The internal ID to merge with (required for 'merge' decision).
         """
         review_item = await self.db_manager.execute_query(
-            "SELECT * FROM mapping_review_queue WHERE id = $1", review_id
+            "SELECT entity_type, source_name, new_entity_data FROM mapping_review_queue "
+            "WHERE id = $1",
+            review_id,
         )
         if not review_item:
             raise ValueError("Review item not found.")
@@ -194,20 +544,18 @@ class EntityMapper:
             if not target_id:
                 raise ValueError("Target ID is required for merge decision.")
             # Merge with the specified existing entity
-            update_query = f"""
-                UPDATE {table}
-                SET external_ids = jsonb_set(COALESCE(external_ids, '{{}}'), '{{{source_name}}}', '"{source_id}"', true)
-                WHERE id = $1;
-            """
-            await self.db_manager.execute_query(update_query, target_id)
+            await self.db_manager.execute_query(
+                _merge_external_id_query(table), target_id, source_name, source_id
+            )
 
         elif decision == "create":
             # Create a new entity
-            new_data["external_ids"] = json.dumps({source_name: source_id})
+            new_data["external_ids"] = {source_name: source_id}
             columns = ", ".join(new_data.keys())
             placeholders = ", ".join([f"${i + 1}" for i in range(len(new_data))])
             insert_query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders});"
             await self.db_manager.execute_query(insert_query, *new_data.values())
+            self.invalidate(entity_type)
 
         elif decision == "discard":
             # Do nothing with the main tables, just update the queue status
@@ -218,7 +566,8 @@ class EntityMapper:
 
         # Update the review item status
         await self.db_manager.execute_query(
-            "UPDATE mapping_review_queue SET status = 'resolved', resolved_at = CURRENT_TIMESTAMP WHERE id = $1",
+            "UPDATE mapping_review_queue SET review_status = 'resolved', "
+            "resolved_at = CURRENT_TIMESTAMP WHERE id = $1",
             review_id,
         )
-        print(f"Review item {review_id} resolved with decision: '{decision}'.")
+        self.logger.info("Review item %s resolved with decision: '%s'.", review_id, decision)
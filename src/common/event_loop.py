@@ -0,0 +1,43 @@
+"""Event loop selection for the CLI entry points.
+
+Call once before ``asyncio.run``; it installs the fastest loop this platform
+offers: uvloop on POSIX, winloop on Windows, and the stdlib selector loop on
+Windows without winloop (avoids "Event loop is closed" noise on shutdown).
+
+Usage:
+    from src.common.event_loop import install_fast_loop
+    install_fast_loop()
+    asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+
+def install_fast_loop(*, subprocesses: bool = False) -> None:
+    """Set the event loop policy for the next ``asyncio.run``.
+
+    ``subprocesses=True`` is for code that spawns processes from the loop
+    (Playwright): on Windows only the Proactor loop supports that, so it is used
+    instead of winloop/selector. POSIX loops, uvloop included, support it anyway.
+    """
+    if sys.platform.startswith("win"):  # pragma: no cover - Windows only
+        if subprocesses:
+            policy = asyncio.WindowsProactorEventLoopPolicy()
+        else:
+            try:
+                import winloop  # type: ignore
+
+                policy = winloop.EventLoopPolicy()
+            except ImportError:  # optional
+                policy = asyncio.WindowsSelectorEventLoopPolicy()
+        asyncio.set_event_loop_policy(policy)
+        return
+    try:
+        import uvloop  # type: ignore
+    except ImportError:  # pragma: no cover - optional, ships with uvicorn[standard]
+        return
+    # same as uvloop.install(), which is deprecated on Python 3.12+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -0,0 +1,49 @@
+"""Per-host concurrency gate for scrapers.
+
+Caps the number of in-flight requests per host (default 4) on top of any global
+semaphore a caller uses. Waiters queue on the host's semaphore and are woken one
+at a time as requests finish, so a fan-out never bursts against a single site.
+
+Usage:
+    from src.common import host_gate
+    async with host_gate.acquire(url):
+        html = await session.get(url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+DEFAULT_PER_HOST = 4
+
+# Semaphores are bound to the loop they first wait on; keep one table per loop.
+_gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _host(url_or_host: str) -> str:
+    if "://" in url_or_host:
+        return (urlsplit(url_or_host).hostname or "").lower()
+    return url_or_host.lower()
+
+
+def gate(url_or_host: str, limit: int = DEFAULT_PER_HOST) -> asyncio.Semaphore:
+    """Semaphore for the host of ``url_or_host``; ``limit`` applies when it is first created."""
+    per_loop = _gates.setdefault(asyncio.get_running_loop(), {})
+    host = _host(url_or_host)
+    sem = per_loop.get(host)
+    if sem is None:
+        sem = per_loop[host] = asyncio.Semaphore(max(1, limit))
+    return sem
+
+
+@asynccontextmanager
+async def acquire(url_or_host: str, limit: int = DEFAULT_PER_HOST) -> AsyncIterator[None]:
+    """Hold one of the host's request slots for the duration of the block."""
+    async with gate(url_or_host, limit):
+        yield
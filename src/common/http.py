@@ -1,6 +1,11 @@
+import asyncio
+import hashlib
+import json
 import random
 import time
 import os
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Any, Optional, Iterable, Sequence, Callable
 
 try:  # Optional playwright dependency isolation
@@ -9,8 +14,11 @@ except Exception:  # pragma: no cover - optional path
     BrowserSession = None  # type: ignore
     RenderWait = None  # type: ignore
 
+import aiohttp
 import requests
 
+from .host_gate import DEFAULT_PER_HOST
+
 # Shared defaults
 DEFAULT_UAS: list[str] = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
@@ -25,6 +33,72 @@ ACCEPT_HEADERS = [
 ]
 
 
+def _cache_paths(cache_dir: Path, url: str) -> tuple[Path, Path]:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.meta.json", cache_dir / f"{key}.html"
+
+
+def _conditional_headers(cache_dir: Path, url: str) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since from a previous 200 response, if its body is cached."""
+    meta_path, body_path = _cache_paths(cache_dir, url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not body_path.exists():
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _read_fresh(cache_dir: Path, url: str, ttl: Optional[float]) -> Optional[str]:
+    """Cached body if it was fetched less than ``ttl`` seconds ago (no network round-trip)."""
+    if not ttl:
+        return None
+    meta_path, body_path = _cache_paths(cache_dir, url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if time.time() - float(meta.get("fetched_at") or 0) >= ttl:
+            return None
+        return body_path.read_text(encoding="utf-8")
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached(cache_dir: Path, url: str, headers: Any, text: str) -> None:
+    meta_path, body_path = _cache_paths(cache_dir, url)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    body_path.write_text(text, encoding="utf-8")
+    meta = {
+        "url": url,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _touch_cached(cache_dir: Path, url: str) -> None:
+    """Restart the TTL of a cached entry after a 304 revalidation."""
+    meta_path, _ = _cache_paths(cache_dir, url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta["fetched_at"] = time.time()
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    except (OSError, ValueError):
+        pass
+
+
+def _revalidated(cache_dir: Path, url: str) -> str:
+    """Body of a cached entry confirmed by a 304; restarts its TTL."""
+    _touch_cached(cache_dir, url)
+    return _cache_paths(cache_dir, url)[1].read_text(encoding="utf-8")
+
+
 def build_headers(
     user_agent: str, *, header_randomize: bool, accept_json: bool = False
 ) -> dict[str, str]:
@@ -61,8 +135,23 @@ def fetch_html(
     force_ua_on_429: bool,
     header_randomize: bool,
     pre_jitter: float,
+    session: Optional[requests.Session] = None,
+    etag_cache_dir: Optional[Path] = None,
+    cache_ttl: Optional[float] = None,
 ) -> str:
-    session = requests.Session()
+    """GET a page as text with retries/backoff.
+
+    With ``etag_cache_dir`` responses are kept on disk: entries younger than
+    ``cache_ttl`` seconds are returned without a request, older ones are
+    revalidated with a conditional GET (ETag/Last-Modified) and a 304 returns
+    the cached body.
+    """
+    if etag_cache_dir is not None:
+        cached = _read_fresh(etag_cache_dir, url, cache_ttl)
+        if cached is not None:
+            return cached
+    # A caller-provided session keeps TCP/TLS connections alive between calls
+    session = session or requests.Session()
     proxies = {"http": proxy, "https": proxy} if proxy else None
     last_status: Optional[int] = None
     ua_pool = user_agents or DEFAULT_UAS
@@ -82,6 +171,8 @@ def fetch_html(
                 last_status=last_status,
             )
             headers = build_headers(ua, header_randomize=header_randomize, accept_json=False)
+            if etag_cache_dir is not None:
+                headers.update(_conditional_headers(etag_cache_dir, url))
             if verbose:
                 print(f"GET {url} [attempt {attempt}] UA={ua[:50]}...")
 
@@ -89,7 +180,13 @@ def fetch_html(
             if r.status_code in (429, 502, 503, 504):
                 last_status = r.status_code
                 raise requests.HTTPError(f"HTTP {r.status_code}")
+            if r.status_code == 304 and etag_cache_dir is not None:
+                if verbose:
+                    print(f"304 Not Modified -> cached body for {url}")
+                return _revalidated(etag_cache_dir, url)
             r.raise_for_status()
+            if etag_cache_dir is not None:
+                _store_cached(etag_cache_dir, url, r.headers, r.text)
             return r.text
         except (requests.Timeout, requests.ConnectionError, requests.HTTPError) as e:
             if attempt >= retries:
@@ -101,6 +198,86 @@ def fetch_html(
     raise RuntimeError("unreachable")
 
 
+def new_async_session(
+    limit: int = 64, limit_per_host: int = DEFAULT_PER_HOST
+) -> aiohttp.ClientSession:
+    """aiohttp session with a keep-alive pool for fetch_html_async (create inside the running loop).
+
+    The per-host pool matches host_gate, which caps in-flight requests per host.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    )
+
+
+def _retry_after_seconds(value: Optional[str], cap: float = 60.0) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date), capped at ``cap``."""
+    if not value:
+        return None
+    try:
+        return min(cap, max(0.0, float(value)))
+    except ValueError:
+        pass
+    try:
+        delta = parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+    return min(cap, max(0.0, delta))
+
+
+async def fetch_html_async(
+    url: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: float = 45.0,
+    retries: int = 3,
+    backoff: float = 1.5,
+    user_agents: Optional[list[str]] = None,
+    header_randomize: bool = True,
+    etag_cache_dir: Optional[Path] = None,
+    cache_ttl: Optional[float] = None,
+) -> str:
+    """Non-blocking counterpart of fetch_html on a shared aiohttp session.
+
+    Retries timeouts, connection errors and HTTP errors with exponential backoff;
+    on 429/503 a Retry-After header takes precedence over the backoff delay.
+    Caching (``etag_cache_dir`` / ``cache_ttl``) behaves as in fetch_html; the cache
+    file I/O runs in a worker thread so it does not stall the event loop.
+    """
+    if etag_cache_dir is not None:
+        cached = await asyncio.to_thread(_read_fresh, etag_cache_dir, url, cache_ttl)
+        if cached is not None:
+            return cached
+    ua = (user_agents or DEFAULT_UAS)[0]
+    for attempt in range(1, max(1, retries) + 1):
+        retry_after: Optional[float] = None
+        try:
+            headers = build_headers(ua, header_randomize=header_randomize, accept_json=False)
+            if etag_cache_dir is not None:
+                headers.update(
+                    await asyncio.to_thread(_conditional_headers, etag_cache_dir, url)
+                )
+            async with session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as r:
+                if r.status == 304 and etag_cache_dir is not None:
+                    return await asyncio.to_thread(_revalidated, etag_cache_dir, url)
+                if r.status in (429, 503):
+                    retry_after = _retry_after_seconds(r.headers.get("Retry-After"))
+                r.raise_for_status()
+                text = await r.text()
+            if etag_cache_dir is not None:
+                await asyncio.to_thread(_store_cached, etag_cache_dir, url, r.headers, text)
+            return text
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= retries:
+                raise
+            if retry_after is None:
+                retry_after = (backoff ** (attempt - 1)) + random.uniform(0.2, 0.6)
+            await asyncio.sleep(retry_after)
+    raise RuntimeError("unreachable")
+
+
 def fetch_json(
     url: str,
     *,
@@ -113,8 +290,9 @@ def fetch_json(
     rotate_ua: bool,
     force_ua_on_429: bool,
     pre_jitter: float,
+    session: Optional[requests.Session] = None,
 ) -> Any:
-    session = requests.Session()
+    session = session or requests.Session()
     proxies = {"http": proxy, "https": proxy} if proxy else None
     last_status: Optional[int] = None
     ua_pool = user_agents or DEFAULT_UAS
@@ -1,8 +1,16 @@
 import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Iterable, Optional, Union
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional C parser, stdlib parser fallback
+    lxml = None
+
+# lxml is a drop-in BeautifulSoup backend and parses large pages several times faster
+HTML_PARSER = "lxml" if lxml is not None else "html.parser"
 
 # Date formats seen commonly across sources
 DATE_FORMATS = [
@@ -13,18 +21,26 @@ DATE_FORMATS = [
     "%d %b %Y",
 ]
 
+# Compiled once; these run per table cell / per row in the scrapers
+_WS_RE = re.compile(r"\s+")
+_INT_RE = re.compile(r"-?\d+")
+_DECIMAL_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# Also covers /profil/spieler/<id> and /profile/player/<id>
+_TM_PLAYER_ID_RE = re.compile(r"/(?:spieler|player)/([0-9]+)")
+_TRAILING_ID_RE = re.compile(r"/(\d+)(?:[^\d]|$)")
+
 
 def clean_text(s: Optional[str]) -> Optional[str]:
     if s is None:
         return None
-    s = re.sub(r"\s+", " ", s.strip())
+    s = _WS_RE.sub(" ", s.strip())
     return s or None
 
 
 def parse_int(s: Optional[str]) -> Optional[int]:
     if not s:
         return None
-    m = re.search(r"-?\d+", s.replace(".", ""))
+    m = _INT_RE.search(s.replace(".", ""))
     return int(m.group(0)) if m else None
 
 
@@ -32,7 +48,7 @@ def parse_decimal(s: Optional[str]) -> Optional[float]:
     if not s:
         return None
     s = s.replace(" ", "").replace(",", ".")
-    m = re.search(r"-?\d+(?:\.\d+)?", s)
+    m = _DECIMAL_RE.search(s)
     return float(m.group(0)) if m else None
 
 
@@ -48,19 +64,21 @@ def parse_date(s: Optional[str]):  # -> Optional[datetime.date] (avoids forward
     return None
 
 
-def soup_from_html(html: str) -> BeautifulSoup:
-    return BeautifulSoup(html, "html.parser")
+def soup_from_html(html: str, only: Union[str, Iterable[str], None] = None) -> BeautifulSoup:
+    # only="table" builds just those subtrees; nav/scripts/footer are skipped while parsing
+    if only is not None:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(only))
+    return BeautifulSoup(html, HTML_PARSER)
 
 
 def extract_tm_player_id_from_href(href: Optional[str]) -> Optional[str]:
     # Examples: /spieler/35616/..., /profile/player/35616
     if not href:
         return None
-    m = re.search(r"/(spieler|player)/([0-9]+)", href)
-    if m:
-        return m.group(2)
-    m = re.search(r"/(profil|profile)/(spieler|player)/([0-9]+)", href)
-    if m:
-        return m.group(3)
-    m = re.search(r"/(\d+)(?:[^\d]|$)", href)
+    m = _TM_PLAYER_ID_RE.search(href) or _TRAILING_ID_RE.search(href)
     return m.group(1) if m else None
+
+
+def extract_tm_player_ids(hrefs: Iterable[Optional[str]]) -> list[Optional[str]]:
+    """Batch variant of extract_tm_player_id_from_href (same order, None for misses)."""
+    return [extract_tm_player_id_from_href(h) for h in hrefs]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import json
 import asyncio
 import random
@@ -83,12 +84,118 @@ async def _apply_waits(page: Page, opts: FetchOptions) -> None:
             await page.wait_for_load_state("networkidle")
 
 
+# Resources not needed for DOM/data extraction; aborted when asset blocking is on.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar", "segment")
+
+
+async def install_asset_blocking(context: Any, resource_types: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+                                 url_parts: Sequence[str] = BLOCKED_URL_PARTS) -> None:
+    """Abort images/fonts/media/styles and known analytics requests on a browser context."""
+    async def _route(route):
+        request = route.request
+        if request.resource_type in resource_types or any(part in request.url for part in url_parts):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _route)
+
+
+# Chromium flags for containers/CI: no /dev/shm reliance, no sandbox, no GPU.
+POOL_LAUNCH_ARGS = ("--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu")
+
+
+class BrowserPool:
+    """One lazily launched Chromium shared by callers in the same process.
+
+    Every ``context()``/``page()`` gets a fresh BrowserContext (isolated cookies
+    and cache) on the shared browser, so only the first caller pays the launch.
+    ``max_contexts`` bounds how many contexts are open at once. Call ``aclose``
+    (or ``close_browser_pool``) on the same event loop before it shuts down.
+    """
+
+    def __init__(self, *, headless: bool = True, max_contexts: int = 4,
+                 launch_args: Sequence[str] = POOL_LAUNCH_ARGS) -> None:
+        self._headless = headless
+        self._launch_args = list(launch_args)
+        self._slots = asyncio.Semaphore(max_contexts)
+        self._lock = asyncio.Lock()
+        self._pw: Any = None
+        self._browser: Any = None
+
+    async def _ensure_browser(self) -> Any:
+        async with self._lock:
+            if self._browser is None:
+                self._pw = await async_playwright().start()
+                self._browser = await self._pw.chromium.launch(headless=self._headless, args=self._launch_args)
+            return self._browser
+
+    @asynccontextmanager
+    async def context(self, *, block_assets: bool = False, **context_args: Any) -> AsyncIterator[Any]:
+        async with self._slots:
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_args)
+            try:
+                if block_assets:
+                    await install_asset_blocking(context)
+                yield context
+            finally:
+                with contextlib.suppress(Exception):
+                    await context.close()
+
+    @asynccontextmanager
+    async def page(self, **kwargs: Any) -> AsyncIterator[Page]:
+        async with self.context(**kwargs) as context:
+            yield await context.new_page()
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            if self._browser is not None:
+                with contextlib.suppress(Exception):
+                    await self._browser.close()
+            if self._pw is not None:
+                with contextlib.suppress(Exception):
+                    await self._pw.stop()
+            self._browser = None
+            self._pw = None
+
+
+_browser_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide BrowserPool, created on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.aclose()
+        _browser_pool = None
+
+
 @asynccontextmanager
 async def browser_page(*, headless: bool = True, user_agent: str | None = None, locale: str | None = None,
-                       viewport: dict[str, int] | None = None, extra_headers: dict[str, str] | None = None) -> AsyncIterator[Page]:
-    """Async context manager yielding a Playwright Page with standard teardown."""
+                       viewport: dict[str, int] | None = None, extra_headers: dict[str, str] | None = None,
+                       block_assets: bool = False, user_data_dir: str | None = None,
+                       storage_state: str | None = None) -> AsyncIterator[Page]:
+    """Async context manager yielding a Playwright Page with standard teardown.
+
+    With ``block_assets`` the context skips static assets and analytics (see
+    ``install_asset_blocking``); leave it off when screenshots must look right.
+    ``user_data_dir`` switches to a persistent context so profile and HTTP
+    cache survive between runs. ``storage_state`` names a JSON file that cookies
+    and local storage are loaded from (when present) and saved back to on exit;
+    it cannot be combined with ``user_data_dir``, whose profile already persists them.
+    """
+    if user_data_dir and storage_state:
+        raise ValueError("storage_state cannot be combined with user_data_dir")
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
         context_args: dict[str, Any] = {}
         if user_agent:
             context_args["user_agent"] = user_agent
@@ -98,15 +205,29 @@ async def browser_page(*, headless: bool = True, user_agent: str | None = None,
             context_args["extra_http_headers"] = extra_headers
         if viewport:
             context_args["viewport"] = viewport
-        context = await browser.new_context(**context_args)
-        page = await context.new_page()
+        if storage_state and os.path.exists(storage_state):
+            context_args["storage_state"] = storage_state
+        browser = None
+        if user_data_dir:
+            context = await p.chromium.launch_persistent_context(user_data_dir, headless=headless, **context_args)
+        else:
+            browser = await p.chromium.launch(headless=headless)
+            context = await browser.new_context(**context_args)
+        if block_assets:
+            await install_asset_blocking(context)
+        # persistent contexts open with a blank page already
+        page = context.pages[0] if user_data_dir and context.pages else await context.new_page()
         try:
             yield page
         finally:
+            if storage_state:
+                with contextlib.suppress(Exception):
+                    await context.storage_state(path=storage_state)
             with contextlib.suppress(Exception):
                 await context.close()
-            with contextlib.suppress(Exception):
-                await browser.close()
+            if browser is not None:
+                with contextlib.suppress(Exception):
+                    await browser.close()
 
 
 async def fetch_page(opts: FetchOptions) -> str:
@@ -533,12 +654,13 @@ async def list_data_testids(page: Page, limit: int = 20) -> List[Dict[str, Any]]
     """Small helper useful for diagnostics to list elements with data-testid."""
     return await page.evaluate(
         r"""(limit) => {
+        const WS = /\s+/g;
         return Array.from(document.querySelectorAll('[data-testid]'))
             .slice(0, limit)
             .map(el => ({
                 tag: el.tagName,
                 testid: el.getAttribute('data-testid'),
-                text: (el.textContent||'').trim().replace(/\s+/g,' ').substring(0, 50),
+                text: (el.textContent||'').trim().replace(WS,' ').slice(0, 50),
                 id: el.id || null,
                 class: el.className || null
             }));
@@ -0,0 +1,79 @@
+"""Per-host leaky-bucket rate limiting for scrapers.
+
+Where host_gate caps how many requests are in flight, a bucket caps how many
+start per second: ``acquire()`` sleeps exactly until the next slot is free
+(monotonic clock accounting) instead of a fixed random delay after every
+request. ``pause()`` blocks the bucket for a while, e.g. for a 429 Retry-After.
+
+Usage:
+    from src.common import rate_limit
+    await rate_limit.bucket(url, rate=2.0).acquire()
+    html = await session.get(url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 2.0  # requests per second and host
+
+
+class AsyncLeakyBucket:
+    """Admit at most ``rate`` acquisitions per second, with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._level = 0.0
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def _leak(self, now: float) -> None:
+        self._level = max(0.0, self._level - (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may start; waiters are admitted in FIFO order."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._leak(now)
+                wait = self._blocked_until - now
+                if wait <= 0 and self._level + 1 <= self.capacity:
+                    self._level += 1
+                    return
+                await asyncio.sleep(max(wait, (self._level + 1 - self.capacity) / self.rate))
+
+    def pause(self, seconds: float) -> None:
+        """Admit nothing for ``seconds`` (one-shot; longer pending pauses win)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + max(0.0, seconds))
+
+
+# Buckets hold an asyncio.Lock bound to its loop; keep one table per loop.
+_buckets: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncLeakyBucket]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _host(url_or_host: str) -> str:
+    if "://" in url_or_host:
+        return (urlsplit(url_or_host).hostname or "").lower()
+    return url_or_host.lower()
+
+
+def bucket(url_or_host: str, rate: float = DEFAULT_RATE, capacity: int = 1) -> AsyncLeakyBucket:
+    """Bucket for the host of ``url_or_host``; ``rate``/``capacity`` apply on first creation."""
+    per_loop = _buckets.setdefault(asyncio.get_running_loop(), {})
+    host = _host(url_or_host)
+    b = per_loop.get(host)
+    if b is None:
+        b = per_loop[host] = AsyncLeakyBucket(rate, capacity)
+    return b
@@ -17,6 +17,10 @@ class Settings(BaseSettings):
     database_pool_size: int = 20
     database_pool_min_size: int = 10
     database_pool_max_size: int = 20
+    # asyncpg: idle pool connections are closed after this many seconds
+    database_pool_max_inactive_lifetime: float = 300.0
+    # asyncpg: prepared statements cached per connection
+    database_statement_cache_size: int = 1024
 
     # Redis
     redis_url: str = "redis://localhost:6379"
@@ -14,7 +14,8 @@ import cloudscraper
 from bs4 import BeautifulSoup
 from playwright.async_api import Browser, Page, async_playwright
 
-from ...common.http import DEFAULT_UAS, build_headers
+from ...common import host_gate, rate_limit
+from ...common.http import DEFAULT_UAS, _retry_after_seconds, build_headers
 
 # =============================================================================
 # 1. SCRAPING CONFIGURATION
@@ -86,7 +87,9 @@ class BaseScraper(ABC):
         self.name = name
         self.logger = logging.getLogger(f"scraper.{name}")
         self.anti_detection = AntiDetectionManager()
+        # Vor initialize() gesetzt wird eine fremde Session geteilt (und nicht geschlossen)
         self.session = None  # type: Optional[aiohttp.ClientSession]
+        self._owns_session = False
         self.scraper = None  # CloudScraper session
         self.cloudscraper = (
             None  # Alias für Kompatibilität zu spezifischen Scraper-Implementierungen
@@ -94,13 +97,21 @@ class BaseScraper(ABC):
 
     async def initialize(self):
         """Initialisiert den Scraper"""
-        # Aiohttp Session
-        connector = aiohttp.TCPConnector(limit=10)
-        self.session = aiohttp.ClientSession(
-            headers=self.anti_detection.session_headers,
-            connector=connector,
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-        )
+        # Aiohttp Session: Keep-Alive Pool; pro Host so groß wie host_gate (einzige Grenze)
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=host_gate.DEFAULT_PER_HOST,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                headers=self.anti_detection.session_headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            )
+            self._owns_session = True
 
         # CloudScraper für Cloudflare-geschützte Seiten
         self.scraper = cloudscraper.create_scraper()
@@ -109,7 +120,7 @@ class BaseScraper(ABC):
 
     async def cleanup(self):
         """Räumt Ressourcen auf"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     @abstractmethod
@@ -128,14 +139,26 @@ class BaseScraper(ABC):
                     response.raise_for_status()
                     return response.text
                 else:
-                    async with self.session.request(method, url, json=data) as response:
-                        response.raise_for_status()
-                        return await response.text()
+                    # Pro Host höchstens host_gate.DEFAULT_PER_HOST Requests gleichzeitig
+                    async with host_gate.acquire(url):
+                        async with self.session.request(method, url, json=data) as response:
+                            response.raise_for_status()
+                            return await response.text()
 
             except Exception as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                retry_after = None
+                if isinstance(e, aiohttp.ClientResponseError) and e.status == 429:
+                    # Retry-After des Servers gilt für alle weiteren Requests an diesen Host
+                    retry_after = _retry_after_seconds((e.headers or {}).get("Retry-After"))
+                    if retry_after:
+                        rate_limit.bucket(url).pause(retry_after)
                 if attempt < self.config.max_retries - 1:
-                    await self.anti_detection.random_delay((2, 5))
+                    if retry_after:
+                        # Auch der eigene Retry wartet die Pause des Hosts ab
+                        await rate_limit.bucket(url).acquire()
+                    else:
+                        await self.anti_detection.random_delay((2, 5))
                 else:
                     raise
 
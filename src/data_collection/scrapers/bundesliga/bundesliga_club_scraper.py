@@ -35,6 +35,7 @@ if TYPE_CHECKING:  # pragma: no cover - import only for type checking
 from pydantic import BaseModel, HttpUrl, field_validator
 
 from ..base import BaseScraper, ScrapingConfig
+from ....common import rate_limit
 from ....domain.models import Footedness  # adjusted relative import path
 from ....common.term_mapper import (
     map_position,
@@ -75,6 +76,9 @@ class BundesligaClubScraperConfig(ScrapingConfig):
     proxy_list: Optional[list[str]] = None
     anti_detection: bool = True
     screenshot_on_error: bool = True
+    # Parallel squad/player fetches, started at most requests_per_second per host
+    max_concurrency: int = 4
+    requests_per_second: float = 2.0
 
 
 class PlayerCareerStats(BaseModel):
@@ -269,34 +273,8 @@ class BundesligaClubScraper(BaseScraper):
     async def scrape_data(self) -> dict[str, Any]:  # type: ignore[override]
         self.logger.info("Starting Bundesliga club -> squad -> player scrape")
         clubs = await self.scrape_clubs()
-        all_squads: dict[str, list[str]] = {}
-        for club in clubs:
-            if not club.squad_url:
-                continue
-            try:
-                squad_links = await self.scrape_squad(club.squad_url, club.name)
-                all_squads[club.name] = squad_links
-            except Exception as e:
-                self.logger.warning(f"Squad scrape failed for {club.name}: {e}")
-            await self.anti_detection.random_delay(self.config.delay_range)
-
-        players_by_club: dict[str, list[EnhancedPlayer]] = {}
-        total_links = sum(len(v) for v in all_squads.values())
-        processed = 0
-        for club_name, links in all_squads.items():
-            club_players: list[EnhancedPlayer] = []
-            for link in links:
-                try:
-                    player = await self.scrape_player(link)
-                    if player:
-                        club_players.append(player)
-                except Exception as e:
-                    self.logger.debug(f"Player scrape failed {link}: {e}")
-                processed += 1
-                if processed % 10 == 0:
-                    self.logger.info("Players scraped %d/%d", processed, total_links)
-                await self.anti_detection.random_delay(self.config.delay_range)
-            players_by_club[club_name] = club_players
+        all_squads = await self.scrape_squads(clubs)
+        players_by_club = await self.scrape_players(all_squads)
 
         return {
             'clubs': clubs,
@@ -332,6 +310,7 @@ class BundesligaClubScraper(BaseScraper):
             if not url:
                 continue
             try:
+                await self._throttle(url)
                 detail_html = await self._fetch_page_dynamic(url)
                 soup_detail = self.parse_html(detail_html)
                 club_data = self._extract_club_data(soup_detail, url)
@@ -401,9 +380,58 @@ class BundesligaClubScraper(BaseScraper):
                 clubs.append(club)
             except Exception as e:
                 self.logger.debug(f"Club detail failed {url}: {e}")
-            await self.anti_detection.random_delay(self.config.delay_range)
         return clubs
 
+    async def _throttle(self, url: str) -> None:
+        """Wait for the host's rate-limit slot (replaces the fixed delay_range sleeps)."""
+        await rate_limit.bucket(url, self.config.requests_per_second).acquire()
+
+    # -------------------- Stages 2/3: bounded fan-out --------------------
+    async def scrape_squads(self, clubs: List[EnhancedClub]) -> dict[str, list[str]]:
+        """Fetch squad pages concurrently (at most ``config.max_concurrency`` in flight)."""
+        sem = asyncio.Semaphore(max(1, self.config.max_concurrency))
+
+        async def one(club: EnhancedClub) -> Optional[list[str]]:
+            async with sem:
+                try:
+                    await self._throttle(club.squad_url)
+                    return await self.scrape_squad(club.squad_url, club.name)
+                except Exception as e:
+                    self.logger.warning(f"Squad scrape failed for {club.name}: {e}")
+                    return None
+
+        with_squad = [c for c in clubs if c.squad_url]
+        results = await asyncio.gather(*(one(c) for c in with_squad))
+        return {c.name: links for c, links in zip(with_squad, results) if links is not None}
+
+    async def scrape_players(self, squads: dict[str, list[str]]) -> dict[str, list[EnhancedPlayer]]:
+        """Fetch all player pages of all squads concurrently, grouped by club in link order."""
+        sem = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        total_links = sum(len(v) for v in squads.values())
+        processed = 0
+
+        async def one(link: str) -> Optional[EnhancedPlayer]:
+            nonlocal processed
+            async with sem:
+                try:
+                    await self._throttle(link)
+                    return await self.scrape_player(link)
+                except Exception as e:
+                    self.logger.debug(f"Player scrape failed {link}: {e}")
+                    return None
+                finally:
+                    processed += 1
+                    if processed % 10 == 0:
+                        self.logger.info("Players scraped %d/%d", processed, total_links)
+
+        per_club = await asyncio.gather(
+            *(asyncio.gather(*(one(link) for link in links)) for links in squads.values())
+        )
+        return {
+            club_name: [p for p in players if p]
+            for club_name, players in zip(squads.keys(), per_club)
+        }
+
     # -------------------- Stage 2: Squad (player link extraction) --------------------
     async def scrape_squad(self, squad_url: str, club_name: str) -> List[str]:
         html = await self.fetch_page(squad_url)
@@ -2210,15 +2238,7 @@ async def _test():  # pragma: no cover
 
 
 if __name__ == "__main__":  # pragma: no cover
-    import sys, os
-    # Align event loop policy choice with run script: Proactor when Playwright requested.
-    if sys.platform.startswith('win'):
-        use_playwright = os.getenv('BUNDESLIGA_USE_PLAYWRIGHT') in ('1','true','True')
-        try:
-            if use_playwright and hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())  # type: ignore[attr-defined]
-            elif not use_playwright and hasattr(asyncio, 'WindowsSelectorEventLoopPolicy'):
-                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore[attr-defined]
-        except Exception:
-            pass
+    from src.common.event_loop import install_fast_loop
+    # Playwright starts the browser as a subprocess: Proactor loop on Windows
+    install_fast_loop(subprocesses=os.getenv('BUNDESLIGA_USE_PLAYWRIGHT') in ('1', 'true', 'True'))
     asyncio.run(_test())
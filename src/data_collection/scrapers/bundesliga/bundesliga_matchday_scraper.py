@@ -280,11 +280,11 @@ async def _run_once(season: str, matchday: int):  # pragma: no cover
 
 
 if __name__ == '__main__':  # pragma: no cover
-    import argparse, sys
+    import argparse
     p = argparse.ArgumentParser(description='Bundesliga matchday scraper (relocated)')
     p.add_argument('season')
     p.add_argument('matchday', type=int)
     args = p.parse_args()
-    if sys.platform.startswith('win') and hasattr(asyncio, 'WindowsSelectorEventLoopPolicy'):
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    from src.common.event_loop import install_fast_loop
+    install_fast_loop()
     asyncio.run(_run_once(args.season, args.matchday))
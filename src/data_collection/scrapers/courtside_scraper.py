@@ -4,10 +4,11 @@ Courtside1891 Scraper for basketball fixtures, teams, and competitions
 
 import asyncio
 import csv
-import json
+import logging
 import os
 from datetime import datetime
 
+import orjson
 from playwright.async_api import Page, async_playwright
 from src.common.playwright_utils import (
     browser_page,
@@ -18,6 +19,7 @@ from src.common.playwright_utils import (
     FetchResult,
     accept_consent,
     infinite_scroll,
+    install_asset_blocking,
     parse_captured_json,
     extract_next_data,
     extract_from_ld_json,
@@ -41,6 +43,10 @@ from src.common.playwright_utils import (
 from src.domain.models import Fixture
 from src.database.manager import DatabaseManager
 
+# DOM markers that the data parsers need; waited for instead of "networkidle"
+FIXTURES_READY_SELECTOR = '[data-testid="fixture-row"], [data-testid*="fixture"], a[href*="/game/"]'
+GAME_READY_SELECTOR = '[data-testid*="home"], [data-testid*="score"], script#__NEXT_DATA__'
+
 
 class CourtsideScraper(BaseScraper):
     """Scraper for Courtside1891 basketball fixtures and team IDs"""
@@ -140,7 +146,9 @@ class CourtsideScraper(BaseScraper):
             html = result.html
             # Attempt structured extraction using a temporary browser_page to evaluate JS (need a page object)
             # Re-render minimal once to run evaluate chain (cheaper than duplicating earlier logic due to hook simplicity)
-            async with browser_page(headless=True, user_agent=opts.user_agent, viewport=opts.viewport) as page:
+            # Only the DOM is evaluated here, so the page's images/fonts/styles are skipped.
+            async with browser_page(headless=True, user_agent=opts.user_agent, viewport=opts.viewport,
+                                    block_assets=True) as page:
                 await page.set_content(html)
                 # Quick data-testid listing for diagnostics
                 try:
@@ -206,6 +214,7 @@ class CourtsideScraper(BaseScraper):
                 async with async_playwright() as p:
                     browser = await p.chromium.launch(headless=True)
                     context = await browser.new_context(user_agent=opts.user_agent, viewport=opts.viewport)
+                    await install_asset_blocking(context)
                     game_links = []
                     for f in fixtures:
                         if f.get("url"):
@@ -282,9 +291,14 @@ class CourtsideScraper(BaseScraper):
 
             page.on("response", _on_response)
 
-            await page.goto(url, timeout=120000, wait_until="networkidle")
+            # networkidle never settles on this SPA (analytics beacons); wait for the game DOM instead.
+            # The game JSON is fetched before the teams render, so captured_json is populated by then.
+            await page.goto(url, timeout=60000, wait_until="domcontentloaded")
             await accept_consent(page)
-            await page.wait_for_timeout(500)
+            try:
+                await page.wait_for_selector(GAME_READY_SELECTOR, state="attached", timeout=15000)
+            except Exception:
+                pass
 
             # Try __NEXT_DATA__ first
             next_items = await extract_next_data(page)
@@ -413,9 +427,8 @@ class CourtsideScraper(BaseScraper):
 
         # Wait for any potential dynamic content
         try:
-            # Try to wait for common loading indicators to disappear
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)  # Additional wait for any remaining JS
+            # Wait for rendered fixtures rather than networkidle (telemetry keeps the network busy)
+            await page.wait_for_selector(FIXTURES_READY_SELECTOR, state="attached", timeout=15000)
 
             # Check if we have any content
             content_check = await page.evaluate(
@@ -437,6 +450,14 @@ class CourtsideScraper(BaseScraper):
         return await page.evaluate(
             """(selectors) => {
             const fixtures = [];
+            // outerHTML serializes the whole subtree: read it once per element and
+            // once per shared parent instead of once per use.
+            const preview = (el, n) => { const html = el.outerHTML; return html.length > n ? html.slice(0, n) + '...' : html; };
+            const parentPreviews = new Map();
+            const parentPreview = (el) => {
+                if (!parentPreviews.has(el)) parentPreviews.set(el, preview(el, 300));
+                return parentPreviews.get(el);
+            };
             
             // First, log all data-testid attributes for debugging
             const allTestIds = Array.from(document.querySelectorAll('[data-testid]'));
@@ -515,9 +536,10 @@ class CourtsideScraper(BaseScraper):
                 try {
                     console.log(`\n--- Processing row ${index + 1}/${rows.length} ---`);
                     
-                    // Log the row HTML for debugging
-                    const rowHtml = row.outerHTML.substring(0, 200) + (row.outerHTML.length > 200 ? '...' : '');
-                    console.log(`Row HTML: ${rowHtml}`);
+                    // Log the row HTML for debugging (first rows only)
+                    if (index < 3) {
+                        console.log(`Row HTML: ${preview(row, 200)}`);
+                    }
                     
                     // Try multiple selector patterns for each field with better debugging
                     const getFirstMatch = (selectors, parent = row) => {
@@ -767,10 +789,8 @@ class CourtsideScraper(BaseScraper):
                         timestamp: new Date().toISOString(),
                         _debug: {
                             selector: rowSelectors.find(sel => row.matches(sel)) || 'unknown',
-                            outerHTML: row.outerHTML.substring(0, 500) + (row.outerHTML.length > 500 ? '...' : ''),
-                            parentHTML: row.parentElement ? 
-                                row.parentElement.outerHTML.substring(0, 300) + 
-                                (row.parentElement.outerHTML.length > 300 ? '...' : '') : 'No parent'
+                            outerHTML: preview(row, 500),
+                            parentHTML: row.parentElement ? parentPreview(row.parentElement) : 'No parent'
                         }
                     };
                     
@@ -800,14 +820,19 @@ class CourtsideScraper(BaseScraper):
 
         # Log extraction results
         self.logger.info(f"Extracted {len(fixtures)} fixtures")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         if fixtures:
-            self.logger.debug(f"Sample fixture: {json.dumps(fixtures[0], indent=2)}")
+            if debug:  # only serialize samples when they are actually logged
+                self.logger.debug("Sample fixture: %s", orjson.dumps(fixtures[0], option=orjson.OPT_INDENT_2).decode())
 
             # Log any fixtures with null values for debugging
             null_fixtures = [f for f in fixtures if not (f.get("home_team") and f.get("away_team"))]
             if null_fixtures:
                 self.logger.warning(f"Found {len(null_fixtures)} fixtures with missing team names")
-                self.logger.debug(f"Sample null fixture: {json.dumps(null_fixtures[0], indent=2)}")
+                if debug:
+                    self.logger.debug(
+                        "Sample null fixture: %s", orjson.dumps(null_fixtures[0], option=orjson.OPT_INDENT_2).decode()
+                    )
 
         return fixtures
 
@@ -941,12 +966,12 @@ class CourtsideScraper(BaseScraper):
         csv_path = os.path.join(out_dir, f"{prefix}_{timestamp}.csv")
 
         # Save JSON
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {"generated_at": timestamp, "count": len(data), "items": data},
-                f,
-                ensure_ascii=False,
-                indent=2,
+        with open(json_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    {"generated_at": timestamp, "count": len(data), "items": data},
+                    option=orjson.OPT_INDENT_2,
+                )
             )
 
         # Save CSV
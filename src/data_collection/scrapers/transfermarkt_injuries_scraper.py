@@ -1,7 +1,6 @@
-from typing import Optional
+from typing import NamedTuple, Optional
 import argparse
 import csv
-import json
 import os
 import random
 import sys
@@ -28,6 +27,7 @@ try:
 except Exception:
     pass
 
+import orjson
 from pydantic import ValidationError
 
 from src.common.db import (
@@ -73,9 +73,20 @@ def _map_absence_to_status(absence_type: str) -> InjuryStatus:
     return InjuryStatus.INJURED
 
 
-def _parse_injuries(html: str) -> list[dict]:
-    soup = soup_from_html(html)
-    results: list[dict] = []
+class InjuryRow(NamedTuple):
+    """One parsed row of the injuries table (dates as ISO strings); ``_asdict()`` for JSON."""
+
+    player_href: Optional[str]
+    player_name: Optional[str]
+    reason: Optional[str]
+    start_date: Optional[str]
+    end_or_expected: Optional[str]
+    missed_games: Optional[int]
+
+
+def _parse_injuries(html: str) -> list[InjuryRow]:
+    soup = soup_from_html(html, only="table")
+    results: list[InjuryRow] = []
     # Generic: find the main table with rows
     table = soup.select_one("table.items, table") or soup.find("table")
     if not table:
@@ -138,14 +149,14 @@ def _parse_injuries(html: str) -> list[dict]:
         missed_games = parse_int(missed_cell.get_text()) if missed_cell else None
 
         results.append(
-            {
-                "player_href": player_href,
-                "player_name": player_name,
-                "reason": reason,
-                "start_date": start_date.isoformat() if start_date else None,
-                "end_or_expected": end_or_expected.isoformat() if end_or_expected else None,
-                "missed_games": missed_games,
-            }
+            InjuryRow(
+                player_href=player_href,
+                player_name=player_name,
+                reason=reason,
+                start_date=start_date.isoformat() if start_date else None,
+                end_or_expected=end_or_expected.isoformat() if end_or_expected else None,
+                missed_games=missed_games,
+            )
         )
     return results
 
@@ -227,11 +238,11 @@ def process_one(args):
     unresolved = 0
     with get_conn() as conn:
         for r in rows:
-            tm_pid = extract_tm_player_id_from_href(r.get("player_href"))
+            tm_pid = extract_tm_player_id_from_href(r.player_href)
             if not tm_pid:
                 unresolved += 1
                 if args.verbose:
-                    print(f"Skip: no TM player id for '{r.get('player_name')}'")
+                    print(f"Skip: no TM player id for '{r.player_name}'")
                 continue
             player_id = find_player_id_by_transfermarkt(conn, tm_pid)
             if not player_id:
@@ -239,16 +250,16 @@ def process_one(args):
                 if args.verbose:
                     print(f"Skip: TM player {tm_pid} not mapped in external_id_map")
                 continue
-            absence_type = _guess_absence_type(r.get("reason"))
+            absence_type = _guess_absence_type(r.reason)
             status = _map_absence_to_status(absence_type)
             try:
                 injury = Injury(
                     player_id=player_id,
                     team_id=None,
-                    description=r.get("reason"),
+                    description=r.reason,
                     status=status,
-                    start_date=r.get("start_date"),
-                    expected_return=r.get("end_or_expected"),
+                    start_date=r.start_date,
+                    expected_return=r.end_or_expected,
                 )
             except ValidationError as ve:
                 unresolved += 1
@@ -267,24 +278,22 @@ def process_one(args):
                 expected_return_date=(
                     injury.expected_return.isoformat() if injury.expected_return else None
                 ),
-                missed_games=r.get("missed_games"),
+                missed_games=r.missed_games,
                 source_url=url,
             )
             upserted += 1
 
-    print(
-        json.dumps(
-            {
-                "source": "transfermarkt",
-                "collector": "injuries",
-                "input": {"url": url, "club_id": args.club_id},
-                "status": "ok",
-                "upserted": upserted,
-                "unresolved": unresolved,
-            },
-            ensure_ascii=False,
-        )
-    )
+    summary = {
+        "source": "transfermarkt",
+        "collector": "injuries",
+        "input": {"url": url, "club_id": args.club_id},
+        "status": "ok",
+        "upserted": upserted,
+        "unresolved": unresolved,
+    }
+    sys.stdout.flush()  # keep ordering with earlier verbose print() output
+    sys.stdout.buffer.write(orjson.dumps(summary, option=orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.flush()
 
 
 def main():
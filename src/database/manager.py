@@ -3,11 +3,13 @@ Database Manager
 Erweiterte Datenbankoperationen mit SQLAlchemy
 """
 
+import functools
 import logging
 from contextlib import asynccontextmanager
 from typing import Any
 
 import asyncpg
+import orjson
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -16,6 +18,29 @@ from src.core.config import settings
 from src.database.schema import Base
 
 
+def _encode_jsonb(value: Any) -> bytes:
+    """Kodiert jsonb binär (Versionsbyte 1 + JSON); JSON-Strings werden durchgereicht"""
+    if isinstance(value, str):
+        return b"\x01" + value.encode("utf-8")
+    return b"\x01" + orjson.dumps(value, default=str)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Dekodiert jsonb im Binärformat (Versionsbyte überspringen) direkt mit orjson"""
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Registriert den orjson jsonb Codec auf jeder Pool-Verbindung"""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
 class DatabaseManager:
     """Erweiterte Datenbankverwaltung mit SQLAlchemy und AsyncPG"""
 
@@ -61,19 +86,28 @@ class DatabaseManager:
             self.SessionLocal = None
             raise
 
-    async def initialize_async(self):
-        """Initialisiert asynchronen asyncpg Pool auf Basis von DATABASE_URL"""
+    async def initialize_async(self, **pool_overrides):
+        """Initialisiert asynchronen asyncpg Pool auf Basis von DATABASE_URL
+
+        ``pool_overrides`` werden an asyncpg.create_pool durchgereicht, z.B. kleinere
+        min_size/max_size für kurzlebige Skripte.
+        """
         try:
             dsn = settings.database_url
             # asyncpg erwartet postgresql:// ohne +asyncpg
             if "+asyncpg" in dsn:
                 dsn = dsn.replace("+asyncpg", "")
-            self.pool = await asyncpg.create_pool(
-                dsn=dsn,
-                min_size=getattr(settings, "database_pool_min_size", 10),
-                max_size=getattr(settings, "database_pool_max_size", 20),
-                command_timeout=60,
-            )
+            pool_kwargs = {
+                "min_size": getattr(settings, "database_pool_min_size", 10),
+                "max_size": getattr(settings, "database_pool_max_size", 20),
+                "max_inactive_connection_lifetime": getattr(
+                    settings, "database_pool_max_inactive_lifetime", 300.0
+                ),
+                "statement_cache_size": getattr(settings, "database_statement_cache_size", 1024),
+                "command_timeout": 60,
+            }
+            pool_kwargs.update(pool_overrides)
+            self.pool = await asyncpg.create_pool(dsn=dsn, init=_init_connection, **pool_kwargs)
             # Leichter Pool-Check
             async with self.pool.acquire() as conn:
                 await conn.fetchval("SELECT 1")
@@ -199,3 +233,9 @@ class DatabaseManager:
         if self.engine:
             self.engine.dispose()
             self.logger.info("Sync database engine disposed")
+
+
+@functools.lru_cache(maxsize=1)
+def get_database_manager() -> DatabaseManager:
+    """Gemeinsame DatabaseManager-Instanz (lazy), z.B. für wiederholt aufgerufene Skript-main()s"""
+    return DatabaseManager()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 import asyncpg
 from src.common.constants import Source, normalize_source
 
@@ -99,6 +99,71 @@ class ExternalIdMappingServiceAsync:
         )
         return int(row[0]) if row else None
 
+    async def ensure_many(
+        self,
+        conn: asyncpg.Connection,
+        *,
+        entity: str,
+        source: str | Source,
+        mappings: Sequence[Tuple[str, int]],
+    ) -> Dict[str, int]:
+        """
+        Mengenbasierte Variante von ensure() für viele (external_id, internal_id) Paare:
+        ein INSERT über unnest() plus ein SELECT zur Prüfung, statt zwei Roundtrips je Paar.
+        Abweichende Mappings -> MappingConflictError; die ganze Transaktion wird zurückgerollt.
+        """
+        if not mappings:
+            return {}
+        table, col = self._resolve(entity)
+        source_norm = normalize_source(source)
+        external_ids = [ext for ext, _ in mappings]
+        internal_ids = [internal for _, internal in mappings]
+        insert_sql = (
+            f"INSERT INTO {table} (source, external_id, {col}) "
+            "SELECT $1, m.external_id, m.internal_id "
+            "FROM unnest($2::text[], $3::bigint[]) AS m(external_id, internal_id) "
+            "ON CONFLICT (source, external_id) DO NOTHING"
+        )
+        select_sql = (
+            f"SELECT external_id, {col} FROM {table} "
+            "WHERE source=$1 AND external_id = ANY($2::text[])"
+        )
+
+        async with conn.transaction():
+            await conn.execute(insert_sql, source_norm, external_ids, internal_ids)
+            rows = await conn.fetch(select_sql, source_norm, external_ids)
+            existing = {row[0]: int(row[1]) for row in rows}
+            result: Dict[str, int] = {}
+            for ext, internal in mappings:
+                mapped = existing.get(ext)
+                if mapped is None:
+                    raise RuntimeError(f"{entity}: mapping for ({source}, {ext}) missing after insert")
+                if mapped != internal:
+                    raise MappingConflictError(
+                        f"{entity}: ({source}, {ext}) already mapped to {mapped}, not {internal}"
+                    )
+                result[ext] = mapped
+            return result
+
+    async def find_many(
+        self,
+        conn: asyncpg.Connection,
+        *,
+        entity: str,
+        source: str | Source,
+        external_ids: Sequence[str],
+    ) -> Dict[str, int]:
+        """Liefert vorhandene Mappings für mehrere external_ids in einer Abfrage."""
+        if not external_ids:
+            return {}
+        table, col = self._resolve(entity)
+        rows = await conn.fetch(
+            f"SELECT external_id, {col} FROM {table} WHERE source=$1 AND external_id = ANY($2::text[])",
+            normalize_source(source),
+            list(external_ids),
+        )
+        return {row[0]: int(row[1]) for row in rows}
+
     # Bequeme Wrapper
     async def ensure_player(self, conn, *, source: str | Source, external_id: str, player_id: int) -> int:
         return await self.ensure(
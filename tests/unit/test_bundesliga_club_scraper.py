@@ -238,6 +238,77 @@ class TestBundesligaClubScraper:
         assert career.season == '2023-24'
         assert career.team == 'FC Bayern München'
 
+    @pytest.mark.asyncio
+    async def test_scrape_players_bounded_concurrency_keeps_order(self, scraper):
+        """Test that player fan-out respects max_concurrency and keeps link order"""
+        scraper.config.max_concurrency = 2
+        scraper.config.requests_per_second = 1000
+        in_flight = peak = 0
+
+        async def fake_player(link):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if link == "bad" else link
+
+        scraper.scrape_player = fake_player
+        result = await scraper.scrape_players({"A": ["a1", "bad", "a2"], "B": ["b1", "b2"]})
+        assert result == {"A": ["a1", "a2"], "B": ["b1", "b2"]}
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_session_is_reused_and_left_open(self, scraper):
+        """Test that a session assigned before initialize() is used and not closed"""
+        import aiohttp
+
+        async with aiohttp.ClientSession() as shared:
+            scraper.session = shared
+            await scraper.initialize()
+            assert scraper.session is shared
+            await scraper.cleanup()
+            assert not shared.closed
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_retry_waits_for_retry_after(self, scraper):
+        """Test that the retry after a 429 waits for Retry-After instead of random_delay"""
+        import time
+
+        import aiohttp
+
+        class FakeResponse:
+            def __init__(self, status, headers=None):
+                self.status = status
+                self.headers = headers or {}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                if self.status >= 400:
+                    raise aiohttp.ClientResponseError(
+                        Mock(real_url="https://www.bundesliga.com/x"),
+                        (),
+                        status=self.status,
+                        headers=self.headers,
+                    )
+
+            async def text(self):
+                return "<html>ok</html>"
+
+        responses = [FakeResponse(429, {"Retry-After": "0.2"}), FakeResponse(200)]
+        scraper.session = Mock(request=lambda *a, **k: responses.pop(0))
+        scraper.anti_detection.random_delay = AsyncMock()
+
+        start = time.monotonic()
+        assert await scraper.fetch_page("https://www.bundesliga.com/x") == "<html>ok</html>"
+        assert time.monotonic() - start >= 0.15
+        scraper.anti_detection.random_delay.assert_not_called()
+
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
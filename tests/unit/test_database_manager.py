@@ -0,0 +1,9 @@
+from src.database.manager import DatabaseManager, get_database_manager
+
+
+def test_get_database_manager_is_cached():
+    get_database_manager.cache_clear()
+    db = get_database_manager()
+    assert isinstance(db, DatabaseManager)
+    assert get_database_manager() is db
+    assert db.pool is None  # nothing is connected until initialize_async()
@@ -0,0 +1,207 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.common.entity_mapper import EntityMapper, _normalize
+
+
+class DummyDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute_query(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows
+
+
+def make_mapper(db):
+    return EntityMapper(db)
+
+
+def test_candidate_query_uses_blocking_and_trigram():
+    mapper = make_mapper(DummyDB([]))
+    query, params = mapper._build_candidate_query(
+        mapper.strategies["team"], {"name": "FC Bayern", "country_id": 7}
+    )
+    assert "country_id = $1" in query
+    assert "name % $2" in query
+    assert "LIMIT $3" in query
+    assert params == [7, "FC Bayern", mapper.CANDIDATE_LIMIT]
+
+
+def test_candidate_query_skips_missing_values():
+    mapper = make_mapper(DummyDB([]))
+    query, params = mapper._build_candidate_query(mapper.strategies["team"], {})
+    assert "WHERE" not in query
+    assert params == []
+
+
+@pytest.mark.asyncio
+async def test_find_best_match_picks_highest_score():
+    rows = [
+        {"id": 1, "name": "Borussia Dortmund", "country_id": 7},
+        {"id": 2, "name": "FC Bayern Munchen", "country_id": 7},
+        {"id": 3, "name": None, "country_id": 7},
+    ]
+    mapper = make_mapper(DummyDB(rows))
+    match_id, score = await mapper._find_best_match(
+        "team", {"name": "FC Bayern München", "country_id": 7}
+    )
+    assert match_id == 2
+    assert score >= mapper.MATCH_THRESHOLD
+
+
+@pytest.mark.asyncio
+async def test_find_best_match_no_candidates():
+    mapper = make_mapper(DummyDB([]))
+    assert await mapper._find_best_match("team", {"name": "X"}) == (None, 0.0)
+
+
+def test_similarity_cache_is_bounded_and_reused():
+    mapper = make_mapper(DummyDB([]))
+    mapper.SIMILARITY_CACHE_SIZE = 2
+    first = mapper._similarity_scores("bayern", ["bayern", "dortmund", "leipzig"])
+    assert first[0] == 100
+    assert len(mapper._similarity_cache) == 2
+    assert ("bayern", "bayern") not in mapper._similarity_cache
+    again = mapper._similarity_scores("bayern", ["leipzig"])
+    assert again[0] == first[2]
+
+
+@pytest.mark.asyncio
+async def test_candidate_cache_until_invalidated():
+    db = DummyDB([{"id": 1, "name": "FC Bayern", "country_id": 7}])
+    mapper = make_mapper(db)
+    data = {"name": "FC Bayern", "country_id": 7}
+    await mapper._find_best_match("team", data)
+    await mapper._find_best_match("team", data)
+    assert len(db.queries) == 1
+    mapper.invalidate("team")
+    await mapper._find_best_match("team", data)
+    assert len(db.queries) == 2
+
+
+class DummyConn:
+    def __init__(self):
+        self.executemany_calls = []
+        self.fetch_calls = []
+
+    async def executemany(self, query, rows):
+        self.executemany_calls.append((query, rows))
+
+    async def fetch(self, query, *args):
+        self.fetch_calls.append((query, args))
+        row_count = query.count("), (") + 1
+        return [{"id": 100 + i} for i in range(row_count)]
+
+
+class DummyBulkDB(DummyDB):
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.conn = DummyConn()
+
+    @asynccontextmanager
+    async def get_async_connection(self):
+        yield self.conn
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_many_batches_writes():
+    db = DummyBulkDB([{"id": 1, "name": "FC Bayern", "country_id": 7}])
+    mapper = make_mapper(db)
+    items = [
+        ({"name": "FC Bayern", "country_id": 7}, "a"),
+        ({"name": "Totally Different", "country_id": 7}, "b"),
+        ({"name": "Another Club", "country_id": 7}, "c"),
+    ]
+    ids = await mapper.find_or_create_many("team", items, "tm")
+    assert ids == [1, 100, 101]
+    assert len(db.conn.executemany_calls) == 1  # merges only
+    assert db.conn.executemany_calls[0][1] == [(1, "tm", "a")]
+    assert len(db.conn.fetch_calls) == 1  # both creates in one INSERT
+
+
+@pytest.mark.asyncio
+async def test_exact_match_skips_fuzzy_scoring(monkeypatch):
+    rows = [
+        {"id": 1, "name": "FC Bayern", "country_id": 7},
+        {"id": 2, "name": "FC Bayern II", "country_id": 7},
+    ]
+    mapper = make_mapper(DummyDB(rows))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("fuzzy scorer should not run")
+
+    monkeypatch.setattr(mapper, "_similarity_scores", fail)
+    assert await mapper._find_best_match("team", {"name": "FC Bayern", "country_id": 7}) == (
+        1,
+        100.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_top_matches_orders_best_first():
+    rows = [
+        {"id": 1, "name": "Bayern Munchen II", "country_id": 7},
+        {"id": 2, "name": "FC Bayern Munchen", "country_id": 7},
+        {"id": 3, "name": "Borussia Dortmund", "country_id": 7},
+        {"id": 4, "name": "Bayern", "country_id": 8},
+    ]
+    mapper = make_mapper(DummyDB(rows))
+    matches = await mapper._find_top_matches(
+        "team", {"name": "FC Bayern München", "country_id": 7}, limit=2
+    )
+    assert [match_id for match_id, _ in matches] == [2, 1]
+    assert matches[0][1] >= matches[1][1]
+
+
+@pytest.mark.asyncio
+async def test_pending_reviews_stream_through_cursor():
+    class CursorConn(DummyConn):
+        def transaction(self):
+            @asynccontextmanager
+            async def tx():
+                yield
+
+            return tx()
+
+        async def cursor(self, query, *args, prefetch=None):
+            self.fetch_calls.append((query, args, prefetch))
+            for i in range(3):
+                yield {"id": i}
+
+    db = DummyBulkDB([])
+    db.conn = CursorConn()
+    mapper = make_mapper(db)
+    assert await mapper.get_pending_reviews("team") == [{"id": 0}, {"id": 1}, {"id": 2}]
+    query, args, prefetch = db.conn.fetch_calls[0]
+    assert "entity_type = $1" in query
+    assert args == ("team",)
+    assert prefetch == 500
+
+
+def test_normalize_ignores_accents_order_and_club_forms():
+    assert _normalize("FC Bayern München") == _normalize("Bayern Munchen FC")
+    assert _normalize("Bayern München II") != _normalize("Bayern München")
+    assert _normalize("FC") == "fc"
+    assert _normalize(None) == ""
+
+
+def test_normalize_does_not_translate_exonyms():
+    from rapidfuzz import fuzz
+
+    mapper = EntityMapper(DummyDB([]))
+    score = fuzz.ratio(_normalize("Bayern Munich FC"), _normalize("FC Bayern München"))
+    # English vs German city name stays a review case, not an automatic match
+    assert mapper.REVIEW_THRESHOLD <= score < mapper.MATCH_THRESHOLD
+
+
+@pytest.mark.asyncio
+async def test_team_matching_uses_normalized_names():
+    rows = [{"id": 4, "name": "Bayern Munchen FC", "country_id": 7}]
+    mapper = EntityMapper(DummyDB(rows))
+    match_id, score = await mapper._find_best_match(
+        "team", {"name": "FC Bayern München", "country_id": 7}
+    )
+    assert (match_id, score) == (4, 100.0)
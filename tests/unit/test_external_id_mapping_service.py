@@ -0,0 +1,57 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.database.services.external_id_mapping_service_async import (
+    ExternalIdMappingServiceAsync,
+    MappingConflictError,
+)
+
+
+class FakeConn:
+    def __init__(self, existing):
+        self.existing = dict(existing)
+        self.calls = []
+
+    def transaction(self):
+        @asynccontextmanager
+        async def tx():
+            yield
+
+        return tx()
+
+    async def execute(self, query, source, external_ids, internal_ids):
+        self.calls.append(("execute", query))
+        for ext, internal in zip(external_ids, internal_ids):
+            self.existing.setdefault(ext, internal)
+        return f"INSERT 0 {len(external_ids)}"
+
+    async def fetch(self, query, source, external_ids):
+        self.calls.append(("fetch", query))
+        return [(ext, self.existing[ext]) for ext in external_ids if ext in self.existing]
+
+
+@pytest.mark.asyncio
+async def test_ensure_many_uses_two_round_trips():
+    conn = FakeConn({"a": 1})
+    svc = ExternalIdMappingServiceAsync()
+    result = await svc.ensure_many(conn, entity="player", source="fbref", mappings=[("a", 1), ("b", 2)])
+    assert result == {"a": 1, "b": 2}
+    assert [kind for kind, _ in conn.calls] == ["execute", "fetch"]
+    assert "unnest($2::text[], $3::bigint[])" in conn.calls[0][1]
+    assert "public.player_external_ids" in conn.calls[0][1]
+
+
+@pytest.mark.asyncio
+async def test_ensure_many_raises_on_conflict():
+    conn = FakeConn({"a": 5})
+    svc = ExternalIdMappingServiceAsync()
+    with pytest.raises(MappingConflictError):
+        await svc.ensure_many(conn, entity="team", source="fbref", mappings=[("a", 1)])
+
+
+@pytest.mark.asyncio
+async def test_many_variants_skip_empty_input():
+    svc = ExternalIdMappingServiceAsync()
+    assert await svc.ensure_many(None, entity="team", source="fbref", mappings=[]) == {}
+    assert await svc.find_many(None, entity="team", source="fbref", external_ids=[]) == {}
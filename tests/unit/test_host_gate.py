@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from src.common import host_gate
+
+
+@pytest.mark.asyncio
+async def test_acquire_caps_in_flight_per_host():
+    in_flight = {"a.example": 0, "b.example": 0}
+    peak = {"a.example": 0, "b.example": 0}
+
+    async def hit(url, host):
+        async with host_gate.acquire(url, limit=2):
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+
+    await asyncio.gather(
+        *(hit(f"https://a.example/p/{i}", "a.example") for i in range(6)),
+        *(hit(f"https://B.example/p/{i}", "b.example") for i in range(3)),
+    )
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+@pytest.mark.asyncio
+async def test_gate_is_shared_by_host():
+    assert host_gate.gate("https://x.example/a") is host_gate.gate("x.example")
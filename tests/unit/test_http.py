@@ -0,0 +1,139 @@
+import aiohttp
+import pytest
+
+from src.common.http import fetch_html, fetch_html_async
+
+
+class FakeResponse:
+    status_code = 200
+    text = "<html></html>"
+
+    def raise_for_status(self):
+        return None
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):  # noqa: ARG002
+        self.urls.append(url)
+        return FakeResponse()
+
+
+def _fetch(url, session):
+    return fetch_html(
+        url,
+        timeout=5,
+        retries=1,
+        backoff=1.0,
+        proxy=None,
+        verbose=False,
+        user_agents=None,
+        rotate_ua=False,
+        force_ua_on_429=False,
+        header_randomize=False,
+        pre_jitter=0.0,
+        session=session,
+    )
+
+
+def test_fetch_html_reuses_given_session():
+    session = FakeSession()
+    assert _fetch("https://a.example/1", session) == "<html></html>"
+    _fetch("https://a.example/2", session)
+    assert session.urls == ["https://a.example/1", "https://a.example/2"]
+
+
+class CachingSession:
+    """Serves 200 with an ETag first, then 304 when revalidated."""
+
+    def __init__(self):
+        self.sent_headers = []
+
+    def get(self, url, headers=None, **kwargs):  # noqa: ARG002
+        self.sent_headers.append(headers or {})
+        resp = FakeResponse()
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            resp.status_code = 304
+            resp.text = ""
+        resp.headers = {"ETag": '"v1"'}
+        return resp
+
+
+def test_fetch_html_conditional_get_uses_cached_body(tmp_path):
+    session = CachingSession()
+    kwargs = dict(
+        timeout=5, retries=1, backoff=1.0, proxy=None, verbose=False, user_agents=None,
+        rotate_ua=False, force_ua_on_429=False, header_randomize=False, pre_jitter=0.0,
+        session=session, etag_cache_dir=tmp_path,
+    )
+    assert fetch_html("https://a.example/p", **kwargs) == "<html></html>"
+    assert fetch_html("https://a.example/p", **kwargs) == "<html></html>"
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+class FakeAsyncResponse:
+    def __init__(self, status, text="", headers=None):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def text(self):
+        return self._text
+
+
+class FakeAsyncSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, url, **kwargs):  # noqa: ARG002
+        return self.responses.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_async_honors_retry_after(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("src.common.http.asyncio.sleep", fake_sleep)
+    session = FakeAsyncSession([
+        FakeAsyncResponse(429, headers={"Retry-After": "7"}),
+        FakeAsyncResponse(200, "<html>ok</html>"),
+    ])
+    assert await fetch_html_async("https://a.example/x", session=session) == "<html>ok</html>"
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_async_raises_after_last_retry(monkeypatch):
+    async def fake_sleep(delay):  # noqa: ARG001
+        return None
+
+    monkeypatch.setattr("src.common.http.asyncio.sleep", fake_sleep)
+    session = FakeAsyncSession([FakeAsyncResponse(500), FakeAsyncResponse(500)])
+    with pytest.raises(aiohttp.ClientResponseError):
+        await fetch_html_async("https://a.example/x", session=session, retries=2)
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_async_serves_fresh_cache_without_request(tmp_path):
+    session = FakeAsyncSession([FakeAsyncResponse(200, "<html>v1</html>", {"ETag": '"v1"'})])
+    url = "https://a.example/cached"
+    first = await fetch_html_async(url, session=session, etag_cache_dir=tmp_path, cache_ttl=60)
+    # No responses left: a second network call would fail with IndexError
+    second = await fetch_html_async(url, session=session, etag_cache_dir=tmp_path, cache_ttl=60)
+    assert first == second == "<html>v1</html>"
@@ -0,0 +1,50 @@
+from src.data_collection.scrapers.transfermarkt_injuries_scraper import InjuryRow, _parse_injuries
+
+INJURIES_HTML = """
+<html><body>
+<table class="items"><thead><tr><th>Spieler</th></tr></thead>
+<tbody>
+<tr>
+  <td><a href="/max-muster/profil/spieler/12345">Max Muster</a></td>
+  <td class="hauptlink">Kreuzbandriss</td>
+  <td>x</td>
+  <td class="zentriert">01.08.2024</td>
+  <td class="zentriert">31.12.2024</td>
+  <td>-</td>
+  <td class="zentriert">7</td>
+</tr>
+<tr><td>too</td><td>short</td></tr>
+</tbody></table>
+</body></html>
+"""
+
+
+def test_parse_injuries_row():
+    rows = _parse_injuries(INJURIES_HTML)
+    assert rows == [
+        InjuryRow(
+            player_href="/max-muster/profil/spieler/12345",
+            player_name="Max Muster",
+            reason="Kreuzbandriss",
+            start_date="2024-08-01",
+            end_or_expected="2024-12-31",
+            missed_games=7,
+        )
+    ]
+    assert rows[0]._asdict()["reason"] == "Kreuzbandriss"
+
+
+def test_extract_tm_player_ids():
+    from src.common.parsing import extract_tm_player_ids
+
+    assert extract_tm_player_ids(
+        ["/max/profil/spieler/12345", "/profile/player/77", "/verein/27/x", None, "/kader"]
+    ) == ["12345", "77", "27", None, None]
+
+
+def test_soup_from_html_only_keeps_requested_tags():
+    from src.common.parsing import soup_from_html
+
+    soup = soup_from_html("<div><a href='/x'>nav</a></div><table><tr><td>1</td></tr></table>", only="table")
+    assert soup.find("a") is None
+    assert soup.find("td").get_text() == "1"
@@ -105,3 +105,133 @@ async def test_fetch_page_retry_and_fail(monkeypatch):
     opts = FetchOptions(url="https://fail.example", retries=2, backoff_base=0.01)
     with pytest.raises(PlaywrightFetchError):
         await fetch_page(opts)
+
+
+@pytest.mark.asyncio
+async def test_install_asset_blocking_aborts_assets_and_analytics():
+    from src.common.playwright_utils import install_asset_blocking
+
+    class Route:
+        def __init__(self, resource_type, url):
+            self.request = types.SimpleNamespace(resource_type=resource_type, url=url)
+            self.outcome = None
+        async def abort(self):
+            self.outcome = "abort"
+        async def continue_(self):
+            self.outcome = "continue"
+
+    class Ctx:
+        async def route(self, pattern, handler):
+            self.pattern, self.handler = pattern, handler
+
+    ctx = Ctx()
+    await install_asset_blocking(ctx)
+    assert ctx.pattern == "**/*"
+    routes = [
+        Route("image", "https://example.org/a.png"),
+        Route("script", "https://www.google-analytics.com/ga.js"),
+        Route("xhr", "https://example.org/api/games"),
+        Route("document", "https://example.org/"),
+    ]
+    for route in routes:
+        await ctx.handler(route)
+    assert [r.outcome for r in routes] == ["abort", "abort", "continue", "continue"]
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_launches_once_and_isolates_contexts(monkeypatch):
+    from src.common.playwright_utils import BrowserPool
+
+    launches = []
+    contexts = []
+
+    class Ctx(DummyContext):
+        closed = False
+        async def close(self):
+            self.closed = True
+
+    class Browser:
+        async def new_context(self, **kwargs):  # noqa: ARG002
+            ctx = Ctx(DummyPage())
+            contexts.append(ctx)
+            return ctx
+        async def close(self):
+            return None
+
+    class PW:
+        async def start(self):
+            return self
+        async def stop(self):
+            return None
+        @property
+        def chromium(self):
+            async def launch(headless=True, args=None):  # noqa: ARG002
+                launches.append(args)
+                return Browser()
+            return types.SimpleNamespace(launch=launch)
+
+    monkeypatch.setattr("src.common.playwright_utils.async_playwright", PW)
+
+    pool = BrowserPool(max_contexts=2)
+    async with pool.page() as p1, pool.page() as p2:
+        assert p1 is not p2
+    async with pool.page():
+        pass
+    await pool.aclose()
+    assert len(launches) == 1
+    assert "--disable-dev-shm-usage" in launches[0]
+    assert len(contexts) == 3 and all(c.closed for c in contexts)
+
+
+@pytest.mark.asyncio
+async def test_browser_page_loads_and_saves_storage_state(monkeypatch, tmp_path):
+    from src.common.playwright_utils import browser_page
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text("{}")
+    seen = {}
+
+    class StateContext(DummyContext):
+        async def storage_state(self, path=None):
+            seen["saved"] = path
+
+    class StateBrowser(DummyBrowser):
+        async def new_context(self, **kwargs):
+            seen["kwargs"] = kwargs
+            return StateContext(self._page)
+
+    class StateP(DummyP):
+        def __init__(self, page):
+            async def launch(headless=True):  # noqa: ARG002
+                return StateBrowser(page)
+            self.chromium = types.SimpleNamespace(launch=launch)
+
+    def fake_async_playwright():
+        class Ctx:
+            async def __aenter__(self_inner):
+                return StateP(DummyPage())
+            async def __aexit__(self_inner, exc_type, exc, tb):  # noqa: ARG002
+                return False
+        return Ctx()
+
+    monkeypatch.setattr("src.common.playwright_utils.async_playwright", fake_async_playwright)
+
+    async with browser_page(storage_state=str(state_file)):
+        pass
+    assert seen["kwargs"]["storage_state"] == str(state_file)
+    assert seen["saved"] == str(state_file)
+
+
+@pytest.mark.asyncio
+async def test_browser_page_rejects_storage_state_with_user_data_dir(monkeypatch, tmp_path):
+    from src.common.playwright_utils import browser_page
+
+    def fail_async_playwright():
+        raise AssertionError("browser must not be launched")
+
+    monkeypatch.setattr("src.common.playwright_utils.async_playwright", fail_async_playwright)
+    with pytest.raises(ValueError):
+        async with browser_page(
+            user_data_dir=str(tmp_path / "profile"), storage_state=str(tmp_path / "s.json")
+        ):
+            pass
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from src.common import rate_limit
+from src.common.rate_limit import AsyncLeakyBucket
+
+
+@pytest.mark.asyncio
+async def test_bucket_spaces_requests_at_rate():
+    bucket = AsyncLeakyBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    # First slot is free, the other five wait 1/50 s each
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_capacity_allows_initial_burst():
+    bucket = AsyncLeakyBucket(rate=1, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_pause_delays_next_acquire():
+    bucket = AsyncLeakyBucket(rate=1000, capacity=5)
+    bucket.pause(0.05)
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_shared_by_host():
+    assert rate_limit.bucket("https://y.example/a") is rate_limit.bucket("Y.example")